@@ -1,11 +1,14 @@
 """Service for logging chat sessions to JSONL files using storage backend."""
+import asyncio
 import json
 import os
 import uuid
+from collections import OrderedDict
 from typing import Dict, List, Tuple, Any, Optional
 import logging
 
 from . import ScenarioInfo, CharacterInfo
+from ..common import json_utils
 from ..common.storage import StorageBackend, StorageError
 from ..common.time_utils import utc_now_isoformat
 # need to make sure we don't cause circular dependency
@@ -13,6 +16,69 @@ from .models import ChatInfo
 
 logger = logging.getLogger(__name__)
 
+# Upper bound on session logs read at once when listing a user's sessions
+_MAX_CONCURRENT_LOG_READS = 16
+
+# Number of ended-session exports kept in memory per process
+_EXPORT_CACHE_SIZE = 32
+
+# Exports of ended sessions, keyed by (storage_path, export_format). Shared at module
+# scope because get_chat_logger builds a new ChatLogger for every request.
+_export_cache: "OrderedDict[Tuple[str, str], str]" = OrderedDict()
+
+# Number of session logs this process remembers ending
+_ENDED_LOGS_SIZE = 1024
+
+# Session logs ended by this process, most recently ended last. ADK sessions live in
+# process memory, so a late append to an ended log (e.g. a voice transcript landing
+# after the user ended the session) comes from the process that ended it.
+_ended_logs: "OrderedDict[str, None]" = OrderedDict()
+
+# Placeholder for display names missing from a session log
+_UNKNOWN = "Unknown"
+
+# Static pieces of the text transcript export
+_BANNER = "=" * 70
+_RULE = "-" * 70
+_TRANSCRIPT_TITLE = (_BANNER, "ROLEPLAY SESSION TRANSCRIPT", _BANNER)
+_CONVERSATION_HEADER = (_RULE, "CONVERSATION:", _RULE, "")
+
+# Map language codes to full names TODO make this available everywhere for consistency
+_LANGUAGE_NAMES = {
+    "en": "English",
+    "zh-TW": "Traditional Chinese",
+    "ja": "Japanese",
+}
+
+
+def _find_session_end(events: List[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """Returns the last session_end event in a log, searching from the end (usually the last event)."""
+    for event in reversed(events):
+        if event.get("type") == "session_end":
+            return event
+    return None
+
+
+def _remember_ended(storage_path: str) -> None:
+    """Records that this process ended a session log, forgetting the oldest beyond the limit."""
+    _ended_logs[storage_path] = None
+    _ended_logs.move_to_end(storage_path)
+    if len(_ended_logs) > _ENDED_LOGS_SIZE:
+        _ended_logs.popitem(last=False)
+
+
+def _remember_export(storage_path: str, export_format: str, export: str) -> str:
+    """Caches the export of an ended session, evicting the least recently used entry."""
+    _export_cache[(storage_path, export_format)] = export
+    if len(_export_cache) > _EXPORT_CACHE_SIZE:
+        _export_cache.popitem(last=False)
+    return export
+
+
+def _created_at_sort_key(summary: Dict[str, Any]) -> str:
+    """Sort key for session summaries; a missing or null created_at sorts as empty."""
+    return summary.get("created_at") or ""
+
 
 class ChatLogger:
     """
@@ -35,6 +101,10 @@ class ChatLogger:
         """Constructs the storage path for a session's chat log."""
         return f"users/{user_id}/chat_logs/{session_id}"
 
+    def _get_session_index_path(self, user_id: str) -> str:
+        """Constructs the storage path for a user's index of ended session summaries."""
+        return f"users/{user_id}/chat_log_index"
+
     async def _parse_jsonl_file(self, storage_path: str) -> List[Dict[str, Any]]:
         """
         Parse JSONL file and return list of events, handling malformed lines gracefully.
@@ -51,23 +121,28 @@ class ChatLogger:
         try:
             async with self.storage.lock(storage_path, timeout=10.0):
                 log_content = await self.storage.read(storage_path)
-                lines = log_content.strip().split('\n')
-                
-                events = []
-                for line_num, line in enumerate(lines):
-                    try:
-                        if line.strip():  # Skip empty lines
-                            events.append(json.loads(line.strip()))
-                    except json.JSONDecodeError:
-                        logger.warning(f"Skipping malformed JSON line {line_num+1} in {storage_path}")
-                        continue
-                return events
+
+            # Parse after releasing the lock; the content is already in memory
+            return self._parse_jsonl_content(storage_path, log_content)
         except StorageError:
             raise
         except Exception as e:
             logger.error(f"Error parsing JSONL file {storage_path}: {e}")
             raise StorageError(f"Failed to parse session log: {e}")
 
+    def _parse_jsonl_content(self, storage_path: str, content: str) -> List[Dict[str, Any]]:
+        """Parses JSONL content read from storage_path, skipping malformed lines."""
+        events = []
+        for line_num, line in enumerate(content.strip().split('\n')):
+            line = line.strip()
+            if not line:  # Skip empty lines
+                continue
+            try:
+                events.append(json_utils.loads(line))
+            except ValueError:
+                logger.warning(f"Skipping malformed JSON line {line_num+1} in {storage_path}")
+        return events
+
     async def start_session(
         self,
         user_id: str,
@@ -165,6 +240,7 @@ class ChatLogger:
                 # Append the message event as a new line
                 event_line = json.dumps(message_event) + '\n'
                 await self.storage.append(storage_path, event_line)
+                await self._log_appended(user_id, storage_path)
             
             logger.debug(f"Logged message to {storage_path} (Msg#: {message_number}, Role: {role})")
         except Exception as e:
@@ -198,48 +274,178 @@ class ChatLogger:
                 # Append the session end event
                 event_line = json.dumps(session_end_event) + '\n'
                 await self.storage.append(storage_path, event_line)
+                _remember_ended(storage_path)
+                # Indexed while holding the log lock, so a late append can only
+                # re-index the session after this entry has been written
+                await self._index_session_log(user_id, storage_path)
             
             logger.info(f"Ended session log for {session_id}")
         except Exception as e:
             logger.error(f"Error ending session log for {session_id}: {e}")
             raise
 
+    async def _summarize_session_log(self, log_key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """
+        Builds the listing summary for one session log.
+
+        Returns:
+            Tuple of (summary or None if the log has no session start, whether the session has ended)
+        """
+        return self._summarize_events(log_key, await self._parse_jsonl_file(log_key))
+
+    def _summarize_events(self, log_key: str, events: List[Dict[str, Any]]) -> Tuple[Optional[Dict[str, Any]], bool]:
+        """Builds the listing summary from a session log's parsed events."""
+        if events:
+            # First event should be session start
+            start_event = events[0]
+            if start_event.get("type") == "session_start":
+                # Count messages using parsed events
+                message_count = sum(1 for event in events if event.get("type") == "message")
+
+                summary = {
+                    "session_id": start_event.get("app_session_id"),
+                    "user_id": start_event.get("user_id"),
+                    # Normalised once here so consumers can build responses without None checks
+                    "participant_name": start_event.get("participant_name") or _UNKNOWN,
+                    "scenario_name": start_event.get("scenario_name") or _UNKNOWN,
+                    "character_name": start_event.get("character_name") or _UNKNOWN,
+                    "created_at": start_event.get("timestamp"),
+                    "storage_path": log_key,
+                    "message_count": message_count,
+                    "ended_at": None,
+                    "ended_reason": None
+                }
+                # End info comes from the same parse; events such as voice_session_end
+                # may still be appended after session_end, so it need not be last
+                end_event = _find_session_end(events)
+                ended = end_event is not None
+                if ended:
+                    summary["ended_at"] = end_event.get("timestamp")
+                    summary["ended_reason"] = end_event.get("reason", "Session ended")
+                return summary, ended
+        return None, False
+
+    def _index_entries(self, index_path: str, content: str) -> Dict[str, Dict[str, Any]]:
+        """Maps each indexed log storage path to its summary."""
+        entries = self._parse_jsonl_content(index_path, content)
+        # Later lines supersede earlier ones; stale markers come from indexes written
+        # before the index was rewritten in place instead of appended to
+        latest = {entry["storage_path"]: entry for entry in entries if "storage_path" in entry}
+        return {path: entry for path, entry in latest.items() if not entry.get("stale")}
+
+    async def _read_session_index(self, user_id: str) -> Dict[str, Dict[str, Any]]:
+        """Reads the user's ended-session index, keyed by log storage path. Missing index is empty."""
+        index_path = self._get_session_index_path(user_id)
+        try:
+            async with self.storage.lock(index_path, timeout=10.0):
+                content = await self.storage.read(index_path)
+        except StorageError:
+            return {}
+        return self._index_entries(index_path, content)
+
+    async def _update_session_index(
+        self,
+        user_id: str,
+        summaries: Dict[str, Optional[Dict[str, Any]]],
+        overwrite: bool = True
+    ) -> None:
+        """
+        Rewrites the user's ended-session index with the given changes applied.
+
+        Args:
+            user_id: The user whose index is updated.
+            summaries: Summary per log storage path; None removes the path's entry.
+            overwrite: Whether to replace existing entries, or only add missing ones.
+        """
+        index_path = self._get_session_index_path(user_id)
+        try:
+            async with self.storage.lock(index_path):
+                try:
+                    index = self._index_entries(index_path, await self.storage.read(index_path))
+                except StorageError:
+                    index = {}
+                for path, summary in summaries.items():
+                    if summary is None:
+                        index.pop(path, None)
+                    elif overwrite or path not in index:
+                        index[path] = summary
+                await self.storage.write(index_path, "".join(json_utils.dumps(s) + '\n' for s in index.values()))
+        except Exception as e:
+            # The index is only an optimization; the logs remain the source of truth
+            logger.warning(f"Failed to update session index {index_path}: {e}")
+
+    async def _index_session_log(self, user_id: str, storage_path: str) -> None:
+        """Indexes the log's current summary if its session has ended. The caller holds the log lock."""
+        try:
+            events = self._parse_jsonl_content(storage_path, await self.storage.read(storage_path))
+        except StorageError as e:
+            logger.warning(f"Failed to read {storage_path} for the session index: {e}")
+            return
+        summary, ended = self._summarize_events(storage_path, events)
+        await self._update_session_index(user_id, {storage_path: summary if ended else None})
+
+    async def _log_appended(self, user_id: str, storage_path: str) -> None:
+        """
+        Called with the log lock held after an event is appended. Only a late append
+        to a session this process ended needs work: its cached export is dropped and
+        its index entry refreshed, so ordinary appends never touch the index.
+        """
+        if storage_path not in _ended_logs:
+            return
+        for export_format in ("text", "json"):
+            _export_cache.pop((storage_path, export_format), None)
+        await self._index_session_log(user_id, storage_path)
+
     async def list_user_sessions(self, user_id: str) -> List[Dict[str, Any]]:
         """
         Lists all sessions for a given user by parsing their JSONL files.
+
+        Summaries of ended sessions are kept in a per-user index, written by end_session
+        and refreshed by late appends (see _log_appended), so only active or not-yet-indexed
+        logs are parsed. Ended logs found here are added to the index and entries of deleted
+        logs are dropped from it.
         """
-        sessions_summary = []
-        
+        # Read the index first, so any indexed path missing from the listed logs was deleted
+        index = await self._read_session_index(user_id)
         # List all chat logs for the user
         chat_logs_prefix = f"users/{user_id}/chat_logs/"
         log_keys = await self.storage.list_keys(chat_logs_prefix)
+        log_key_set = set(log_keys)
+        pending_keys = [log_key for log_key in log_keys if log_key not in index]
+
+        # Session logs are independent, so read them concurrently (bounded)
+        semaphore = asyncio.Semaphore(_MAX_CONCURRENT_LOG_READS)
+
+        async def summarize_bounded(log_key: str) -> Tuple[Optional[Dict[str, Any]], bool]:
+            async with semaphore:
+                return await self._summarize_session_log(log_key)
+
+        results = await asyncio.gather(
+            *(summarize_bounded(log_key) for log_key in pending_keys), return_exceptions=True
+        )
+
+        sessions_summary = [index[log_key] for log_key in log_keys if log_key in index]
+        newly_ended = []
+        for log_key, result in zip(pending_keys, results):
+            if isinstance(result, Exception):
+                logger.error(f"Error reading session summary from {log_key}: {result}")
+                continue
+            summary, ended = result
+            if summary is not None:
+                sessions_summary.append(summary)
+                if ended:
+                    newly_ended.append(summary)
+
+        index_changes = {path: None for path in index if path not in log_key_set}
+        index_changes.update((summary["storage_path"], summary) for summary in newly_ended)
+        if index_changes:
+            # Only missing entries are added: an entry written meanwhile by end_session or a
+            # late append was summarized under the log lock and is newer than these
+            await self._update_session_index(user_id, index_changes, overwrite=False)
         
-        for log_key in log_keys:
-            try:
-                events = await self._parse_jsonl_file(log_key)
-                
-                if events:
-                    # First event should be session start
-                    start_event = events[0]
-                    if start_event.get("type") == "session_start":
-                        # Count messages using parsed events
-                        message_count = sum(1 for event in events if event.get("type") == "message")
-
-                        sessions_summary.append({
-                            "session_id": start_event.get("app_session_id"),
-                            "user_id": start_event.get("user_id"),
-                            "participant_name": start_event.get("participant_name"),
-                            "scenario_name": start_event.get("scenario_name"),
-                            "character_name": start_event.get("character_name"),
-                            "created_at": start_event.get("timestamp"),
-                            "storage_path": log_key,
-                            "message_count": message_count
-                        })
-            except Exception as e:
-                logger.error(f"Error reading session summary from {log_key}: {e}")
-        
-        # Sort by creation time (newest first)
-        sessions_summary.sort(key=lambda s: s.get("created_at", ""), reverse=True)
+        # Sort by creation time (newest first); sort() evaluates the key once per
+        # summary, and logs without a start timestamp sort last instead of failing
+        sessions_summary.sort(key=_created_at_sort_key, reverse=True)
         return sessions_summary
 
     async def get_session_end_info(self, user_id: str, session_id: str) -> Dict[str, Any]:
@@ -254,18 +460,16 @@ class ChatLogger:
         try:
             events = await self._parse_jsonl_file(storage_path)
             
-            # Look for session_end event (usually last event)
-            for event in reversed(events):
-                if event.get("type") == "session_end":
-                    return {
-                        "ended_at": event.get("timestamp"),
-                        "reason": event.get("reason", "Session ended"),
-                        "total_messages": event.get("total_messages", 0),
-                        "duration_seconds": event.get("duration_seconds", 0)
-                    }
-            
-            # No session_end event found
-            return {}
+            event = _find_session_end(events)
+            if event is None:
+                # No session_end event found
+                return {}
+            return {
+                "ended_at": event.get("timestamp"),
+                "reason": event.get("reason", "Session ended"),
+                "total_messages": event.get("total_messages", 0),
+                "duration_seconds": event.get("duration_seconds", 0)
+            }
         except StorageError as e:
             logger.warning(f"Session log not found for {session_id}: {e}")
             return {}
@@ -313,6 +517,9 @@ class ChatLogger:
             session_id: The session ID to delete
         """
         storage_path = self._get_chat_log_path(user_id, session_id)
+        _ended_logs.pop(storage_path, None)
+        for export_format in ("text", "json"):
+            _export_cache.pop((storage_path, export_format), None)
         
         try:
             async with self.storage.lock(storage_path, timeout=10.0):
@@ -332,10 +539,13 @@ class ChatLogger:
         format: text or json
         """
         storage_path = self._get_chat_log_path(user_id, session_id)
-        
-        if not await self.storage.exists(storage_path):
-            logger.warning(f"Attempted to export non-existent session: {storage_path}")
-            return "Session log file not found."
+
+        cache_key = (storage_path, export_format)
+        cached = _export_cache.get(cache_key)
+        # The existence check keeps sessions deleted through another instance from being served
+        if cached is not None and await self.storage.exists(storage_path):
+            _export_cache.move_to_end(cache_key)
+            return cached
 
         lines = []
         session_info = {}
@@ -344,20 +554,24 @@ class ChatLogger:
 
         try:
             events = await self._parse_jsonl_file(storage_path)
-            
-            # Categorize events
-            for event in events:
-                entry_type = event.get("type")
-                if entry_type == "session_start":
-                    session_info = event
-                elif entry_type == "message":
-                    messages.append(event)
-                elif entry_type == "session_end":
-                    session_ended_info = event
         except Exception as e:
+            # Existence is only probed on failure so a successful export costs a single read
+            if not await self.storage.exists(storage_path):
+                logger.warning(f"Attempted to export non-existent session: {storage_path}")
+                return "Session log file not found."
             logger.error(f"Error reading session file {storage_path} for export: {e}")
             return f"Error processing session file: {str(e)}"
 
+        # Categorize events
+        for event in events:
+            entry_type = event.get("type")
+            if entry_type == "session_start":
+                session_info = event
+            elif entry_type == "message":
+                messages.append(event)
+            elif entry_type == "session_end":
+                session_ended_info = event
+
         speaker_map = {
             "participant": session_info.get('participant_name', 'Participant'),
             "character": session_info.get('character_name', 'Character'),
@@ -365,10 +579,11 @@ class ChatLogger:
         }
 
         if export_format == "json":
-            transcript_lines = []
-            for msg in messages:
-                speaker = speaker_map[msg["role"].lower()]
-                transcript_lines.append(f"{speaker}: {msg['content']}")
+            # One join over a list comprehension: a single final allocation,
+            # without the per-line append calls
+            transcript_text = "\n".join([
+                f"{speaker_map[msg['role'].lower()]}: {msg['content']}" for msg in messages
+            ])
 
             # Load full scenario and character data if content_loader is available
             scenario_description = ""
@@ -387,14 +602,8 @@ class ChatLogger:
                 description=character_description
             )
 
-            # Map language codes to full names TODO make this available everywhere for consistency
-            language_names = {
-                "en": "English",
-                "zh-TW": "Traditional Chinese",
-                "ja": "Japanese"
-            }
             session_language = session_info.get("session_language", "en")
-            chat_language = language_names.get(session_language, "English")
+            chat_language = _LANGUAGE_NAMES.get(session_language, "English")
 
             chat_info = ChatInfo(
                 chat_session_id=session_info.get("app_session_id", ""),
@@ -403,18 +612,19 @@ class ChatLogger:
                 char_info=char_info,
                 goal=goal,
                 participant_name=session_info.get("participant_name", "Participant"),
-                transcript_text="\n".join(transcript_lines)
+                transcript_text=transcript_text
             )
 
-            return json.dumps(chat_info.model_dump(), sort_keys=True)
+            export = json.dumps(chat_info.model_dump(), sort_keys=True)
+            if session_ended_info:
+                return _remember_export(storage_path, export_format, export)
+            return export
 
         # elif format != "text":
         #     return f"Error invalid format {format}"
 
         # Format the transcript
-        lines.append("=" * 70)
-        lines.append("ROLEPLAY SESSION TRANSCRIPT")
-        lines.append("=" * 70)
+        lines.extend(_TRANSCRIPT_TITLE)
         lines.append(f"  Session ID: {session_info.get('app_session_id', 'Unknown')}")
         lines.append(f"  User ID: {session_info.get('user_id', 'Unknown')}")
         lines.append(f"  Participant: {session_info.get('participant_name', 'Unknown')}")
@@ -425,27 +635,22 @@ class ChatLogger:
         lines.append(f"  Started: {session_info.get('timestamp', 'Unknown')}")
         lines.append("")
 
-        lines.append("-" * 70)
-        lines.append("CONVERSATION:")
-        lines.append("-" * 70)
-        lines.append("")
+        lines.extend(_CONVERSATION_HEADER)
 
+        # One entry per message (header, indented content, blank separator) keeps
+        # the joined output identical while cutting the list to a third of the size
         for msg in messages:
-            speaker_map = {
-                "participant": session_info.get('participant_name', 'Participant'),
-                "character": session_info.get('character_name', 'Character'),
-                "system": "System"
-            }
             speaker = speaker_map.get(msg.get("role", "unknown").lower(), msg.get("role", "Unknown"))
-            lines.append(f"[{msg.get('message_number', 'N/A')}] {speaker} ({msg.get('timestamp')}):")
-            lines.append(f"  {msg.get('content', '')}")
-            lines.append("")
+            lines.append(
+                f"[{msg.get('message_number', 'N/A')}] {speaker} ({msg.get('timestamp')}):\n"
+                f"  {msg.get('content', '')}\n"
+            )
 
         if not messages:
             lines.append("[No messages in session]")
             lines.append("")
 
-        lines.append("=" * 70)
+        lines.append(_BANNER)
         if session_ended_info:
             lines.append("SESSION ENDED")
             lines.append(f"  Ended At: {session_ended_info.get('timestamp')}")
@@ -455,9 +660,12 @@ class ChatLogger:
                 lines.append(f"  Reason: {session_ended_info.get('reason')}")
         else:
             lines.append("SESSION ACTIVE OR NOT PROPERLY ENDED")
-        lines.append("=" * 70)
+        lines.append(_BANNER)
 
-        return "\n".join(lines)
+        export = "\n".join(lines)
+        if session_ended_info:
+            return _remember_export(storage_path, export_format, export)
+        return export
 
     async def log_voice_message(
             self,
@@ -509,6 +717,7 @@ class ChatLogger:
                 # Append the message event as a new line
                 event_line = json.dumps(message_event) + '\n'
                 await self.storage.append(storage_path, event_line)
+                await self._log_appended(user_id, storage_path)
 
             logger.debug(f"Logged voice message to {storage_path} (Msg#: {message_number}, Role: {role}, Duration: {duration_ms}ms)")
         except Exception as e:
@@ -573,6 +782,7 @@ class ChatLogger:
                 # Append the voice session start event
                 event_line = json.dumps(voice_start_event) + '\n'
                 await self.storage.append(storage_path, event_line)
+                await self._log_appended(user_id, storage_path)
             logger.info(f"Logged voice session start for {session_id}")
         except Exception as e:
             logger.error(f"Error logging voice session start for {session_id}: {e}")
@@ -596,6 +806,7 @@ class ChatLogger:
                 # Append the voice session end event
                 event_line = json.dumps(voice_end_event) + '\n'
                 await self.storage.append(storage_path, event_line)
+                await self._log_appended(user_id, storage_path)
 
             logger.info(f"Logged voice session end for {session_id}")
         except Exception as e:
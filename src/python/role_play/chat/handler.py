@@ -431,13 +431,12 @@ class ChatHandler(BaseHandler):
                 )
                 is_active = adk_session is not None
                 
-                # If session is not active, try to get end info
+                # If session is not active, the summary carries its end info from the same log parse
                 ended_at = None
                 ended_reason = None
                 if not is_active:
-                    end_info = await chat_logger.get_session_end_info(current_user.id, session_id)
-                    ended_at = end_info.get("ended_at")
-                    ended_reason = end_info.get("reason")
+                    ended_at = s_data.get("ended_at")
+                    ended_reason = s_data.get("ended_reason")
                 
                 session_info = SessionInfo(
                     session_id=session_id,
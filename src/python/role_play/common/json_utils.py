@@ -0,0 +1,29 @@
+"""
+JSON helpers for hot serialization paths.
+
+Uses orjson when it is installed and falls back to the standard library
+otherwise. Output is always compact UTF-8 text, and decode errors are raised
+as ``json.JSONDecodeError`` (orjson's error type subclasses it).
+"""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None
+
+
+def dumps(obj: Any, *, sort_keys: bool = False) -> str:
+    """Serialize ``obj`` to a compact JSON string."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_SORT_KEYS if sort_keys else 0).decode()
+    return json.dumps(obj, sort_keys=sort_keys, separators=(",", ":"), ensure_ascii=False)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Deserialize a JSON document from ``str`` or ``bytes``."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -2,7 +2,7 @@ import asyncio
 import json
 import logging
 import os
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 from role_play.common.storage import StorageBackend
 
@@ -17,6 +17,8 @@ class ResourceLoader:
         self.storage = storage
         self.base_prefix = base_prefix
         self._cache: Dict[str, Any] = {}  # Internal cache: stores loaded JSON content
+        self._id_index: Dict[str, Dict[str, dict]] = {}  # Per-file index: resource ID -> resource
+        self._path_cache: Dict[Tuple[str, str], str] = {}  # (resource_type, language) -> resolved file path
 
     async def _load_and_cache_json(self, path: str) -> Any:
         """Loads a specific JSON file from storage, validates version, and caches its content."""
@@ -46,14 +48,24 @@ class ResourceLoader:
         """
         if path:
             self._cache.pop(path, None)
+            self._id_index.pop(path, None)
+            for key in [k for k, v in self._path_cache.items() if v == path]:
+                del self._path_cache[key]
         else:
             self._cache.clear()
+            self._id_index.clear()
+            self._path_cache.clear()
 
     async def _find_resource_path(self, resource_type: str, language: str) -> str | None:
         """
         Finds the correct resource file path for a given type and language.
         Example: resource_type='scenarios', language='zh-TW' -> 'resources/scenarios/scenarios_zh-TW.json'
+        Resolved paths are cached until invalidate_cache() so lookups don't list storage every time.
         """
+        cached_path = self._path_cache.get((resource_type, language))
+        if cached_path is not None:
+            return cached_path
+
         # Always use forward slashes for storage prefixes
         prefix = f"{self.base_prefix}{resource_type}/"
         logger.debug(f"Searching for '{resource_type}' resources in language '{language}' with prefix: '{prefix}'")
@@ -70,6 +82,7 @@ class ResourceLoader:
         for file_path in all_files:
             if file_path.endswith(lang_suffix):
                 logger.info(f"Found language-specific resource file: {file_path}")
+                self._path_cache[(resource_type, language)] = file_path
                 return file_path
 
         # Fallback to the default resource file (e.g., scenarios.json)
@@ -78,6 +91,7 @@ class ResourceLoader:
             # Check basename to avoid matching directories like 'scenarios.json_bak'
             if file_path.endswith(default_file_name) and os.path.basename(file_path) == default_file_name:
                 logger.info(f"Found default resource file as fallback: {file_path}")
+                self._path_cache[(resource_type, language)] = file_path
                 return file_path
         
         logger.warning(f"No resource file found for type '{resource_type}' and language '{language}'")
@@ -88,7 +102,10 @@ class ResourceLoader:
         path = await self._find_resource_path(resource_type, language)
         if not path:
             return []
-        
+        return await self._load_resources(resource_type, path)
+
+    async def _load_resources(self, resource_type: str, path: str) -> list[dict]:
+        """Loads the items of a resource type from an already resolved file path."""
         try:
             data = await self._load_and_cache_json(path)
             resources = data.get(resource_type, [])
@@ -99,6 +116,21 @@ class ResourceLoader:
             logger.error(f"Failed to load or parse resource file {path}: {e}", exc_info=True)
             return []
 
+    async def _get_by_id(self, resource_type: str, resource_id: str, language: str) -> dict | None:
+        """Gets a single resource by ID using an index built once per resource file."""
+        path = await self._find_resource_path(resource_type, language)
+        if not path:
+            return None
+
+        index = self._id_index.get(path)
+        if index is None:
+            resources = await self._load_resources(resource_type, path)
+            # Reversed so the first entry wins when IDs are duplicated
+            index = {r.get("id"): r for r in reversed(resources)}
+            if resources:
+                self._id_index[path] = index
+        return index.get(resource_id)
+
     async def get_scenarios(self, language: str = "en") -> list[dict]:
         """Loads all scenarios for a specific language."""
         return await self._get_all_from_resource_type("scenarios", language)
@@ -109,13 +141,11 @@ class ResourceLoader:
 
     async def get_scenario_by_id(self, scenario_id: str, language: str = "en") -> dict | None:
         """Gets a single scenario by its ID for the specified language."""
-        scenarios = await self.get_scenarios(language)
-        return next((s for s in scenarios if s.get("id") == scenario_id), None)
+        return await self._get_by_id("scenarios", scenario_id, language)
 
     async def get_character_by_id(self, character_id: str, language: str = "en") -> dict | None:
         """Gets a single character by its ID for the specified language."""
-        characters = await self.get_characters(language)
-        return next((c for c in characters if c.get("id") == character_id), None)
+        return await self._get_by_id("characters", character_id, language)
 
     async def get_scripts(self, language: str = "en") -> list[dict]:
         """Loads all scripts for a specific language."""
@@ -123,5 +153,4 @@ class ResourceLoader:
 
     async def get_script_id(self, script_id: str, language: str = "en") -> dict | None:
         """Gets a single script by its ID for the specified language."""
-        scripts = await self.get_scripts(language)
-        return next((s for s in scripts if s.get("id") == script_id), None)
+        return await self._get_by_id("scripts", script_id, language)
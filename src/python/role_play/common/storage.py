@@ -590,14 +590,26 @@ class FileStorage(StorageBackend):
         
         async with self.monitor.monitor_storage_operation("list"):
             if await asyncio.to_thread(prefix_path.exists):
-                # Run the blocking rglob operation in a thread
+                # Run the blocking directory walk in a thread; scandir's DirEntry
+                # answers is_dir/is_file from the directory listing, avoiding the
+                # per-entry Path objects and stat calls of rglob
+                root_len = len(str(self.storage_dir)) + 1
+
                 def _list_files():
                     result = []
-                    for file_path in prefix_path.rglob('*'):
-                        if file_path.is_file() and not file_path.name.startswith('.'):
-                            # Convert back to storage key format
-                            relative_path = file_path.relative_to(self.storage_dir)
-                            result.append(str(relative_path))
+                    pending = [str(prefix_path)]
+                    while pending:
+                        try:
+                            entries = os.scandir(pending.pop())
+                        except (NotADirectoryError, FileNotFoundError):
+                            continue
+                        with entries:
+                            for entry in entries:
+                                if entry.is_dir(follow_symlinks=False):
+                                    pending.append(entry.path)
+                                elif entry.is_file() and not entry.name.startswith('.'):
+                                    # Convert back to storage key format
+                                    result.append(entry.path[root_len:])
                     return result
                 
                 keys = await asyncio.to_thread(_list_files)
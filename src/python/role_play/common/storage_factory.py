@@ -11,6 +11,13 @@ from .storage import (
 from .exceptions import StorageError
 
 
+# Environments where only cloud storage backends are permitted
+_CLOUD_ONLY_ENVS = frozenset({Environment.BETA, Environment.PROD})
+
+# Lowercase environment name -> Environment, for string normalization
+_ENV_LOOKUP = {env.value: env for env in Environment}
+
+
 def create_storage_backend(
     config: StorageConfigUnion,
     environment: Union[Environment, str] = Environment.DEV
@@ -32,28 +39,29 @@ def create_storage_backend(
     Raises:
         StorageError: If configuration is invalid or environment restrictions are violated
     """
-    # Normalize environment
-    if isinstance(environment, str):
-        try:
-            environment = Environment(environment.lower())
-        except ValueError:
+    # Normalize environment; anything other than a known name is rejected
+    if not isinstance(environment, Environment):
+        normalized = _ENV_LOOKUP.get(environment.lower()) if isinstance(environment, str) else None
+        if normalized is None:
             raise StorageError(f"Invalid environment: {environment}. Must be one of: {list(Environment)}")
+        environment = normalized
     
+    storage_type = config.type
+
     # Enforce environment restrictions
-    if environment in (Environment.BETA, Environment.PROD):
-        if config.type == "file":
-            raise StorageError(
-                f"File-based storage not allowed in {environment.value} environment. "
-                "Use 'gcs' or 's3' for production deployments."
-            )
+    if storage_type == "file" and environment in _CLOUD_ONLY_ENVS:
+        raise StorageError(
+            f"File-based storage not allowed in {environment.value} environment. "
+            "Use 'gcs' or 's3' for production deployments."
+        )
     
     # Create storage backend based on type
-    if config.type == "file":
+    if storage_type == "file":
         if not isinstance(config, FileStorageConfig):
             raise StorageError("Invalid configuration type for file storage")
         return FileStorage(config)
     
-    elif config.type == "gcs":
+    elif storage_type == "gcs":
         if not isinstance(config, GCSStorageConfig):
             raise StorageError("Invalid configuration type for GCS storage")
         
@@ -64,7 +72,7 @@ def create_storage_backend(
         except ImportError as e:
             raise StorageError(f"GCS dependencies not available: {e}")
     
-    elif config.type == "s3":
+    elif storage_type == "s3":
         if not isinstance(config, S3StorageConfig):
             raise StorageError("Invalid configuration type for S3 storage")
         
@@ -76,7 +84,7 @@ def create_storage_backend(
             raise StorageError(f"S3 dependencies not available: {e}")
     
     else:
-        raise StorageError(f"Unsupported storage type: {config.type}")
+        raise StorageError(f"Unsupported storage type: {storage_type}")
 
 
 def create_storage_from_env(environment: Union[Environment, str] = None) -> StorageBackend:
@@ -112,9 +120,8 @@ def create_storage_from_env(environment: Union[Environment, str] = None) -> Stor
     # Auto-detect environment if not provided
     if environment is None:
         env_str = os.getenv("ENV", "dev").lower()
-        try:
-            environment = Environment(env_str)
-        except ValueError:
+        environment = _ENV_LOOKUP.get(env_str)
+        if environment is None:
             raise StorageError(f"Invalid ENV environment variable: {env_str}")
     
     # Get storage type
@@ -186,97 +193,45 @@ def create_storage_from_env(environment: Union[Environment, str] = None) -> Stor
     return create_storage_backend(config, environment)
 
 
+# Declarative storage config rules, checked in order by validate_storage_config.
+# Each entry is (violation predicate, error message formatted with ``config``).
+_STORAGE_CONFIG_RULES = (
+    # Lock strategy compatibility
+    (lambda c: c.type == "file" and c.lock.strategy not in ("file", "redis"),
+     "Lock strategy '{config.lock.strategy}' not supported for file storage"),
+    (lambda c: c.type in ("gcs", "s3") and c.lock.strategy == "file",
+     "File-based locking not supported for {config.type} storage"),
+    # Redis configuration if using Redis locking
+    (lambda c: c.lock.strategy == "redis" and not c.lock.redis_host,
+     "redis_host is required when using Redis locking strategy"),
+    # Type-specific requirements
+    (lambda c: isinstance(c, FileStorageConfig) and not c.base_dir,
+     "base_dir is required for file storage"),
+    (lambda c: isinstance(c, GCSStorageConfig) and not c.bucket,
+     "bucket is required for GCS storage"),
+    (lambda c: isinstance(c, S3StorageConfig) and not c.bucket,
+     "bucket is required for S3 storage"),
+)
+
+
 def validate_storage_config(config: StorageConfigUnion) -> None:
     """
-    Validate storage configuration.
+    Validate storage configuration against ``_STORAGE_CONFIG_RULES``.
     
     Args:
         config: Storage configuration to validate
         
     Raises:
-        StorageError: If configuration is invalid
+        StorageError: On the first rule the configuration violates
     """
-    # Validate lock strategy compatibility
-    if config.type == "file" and config.lock.strategy not in ("file", "redis"):
-        raise StorageError(f"Lock strategy '{config.lock.strategy}' not supported for file storage")
-    
-    if config.type in ("gcs", "s3") and config.lock.strategy == "file":
-        raise StorageError(f"File-based locking not supported for {config.type} storage")
-    
-    # Validate Redis configuration if using Redis locking
-    if config.lock.strategy == "redis":
-        if not config.lock.redis_host:
-            raise StorageError("redis_host is required when using Redis locking strategy")
-    
-    # Type-specific validations
-    if isinstance(config, FileStorageConfig):
-        if not config.base_dir:
-            raise StorageError("base_dir is required for file storage")
-    
-    elif isinstance(config, GCSStorageConfig):
-        if not config.bucket:
-            raise StorageError("bucket is required for GCS storage")
-    
-    elif isinstance(config, S3StorageConfig):
-        if not config.bucket:
-            raise StorageError("bucket is required for S3 storage")
+    for violated, message in _STORAGE_CONFIG_RULES:
+        if violated(config):
+            raise StorageError(message.format(config=config))
 
 
-# Example YAML configurations for documentation
-EXAMPLE_CONFIGS = {
-    "dev_file": """
-storage:
-  type: file
-  base_dir: ./data
-  lock:
-    strategy: file
-    lease_duration_seconds: 60
-    retry_attempts: 3
-    retry_delay_seconds: 1.0
-""",
-    
-    "dev_gcs": """
-storage:
-  type: gcs
-  bucket: my-dev-bucket
-  prefix: roleplay-dev/
-  project_id: my-gcp-project
-  credentials_file: /path/to/service-account.json
-  lock:
-    strategy: object
-    lease_duration_seconds: 60
-    retry_attempts: 3
-    retry_delay_seconds: 1.0
-""",
-    
-    "prod_gcs_redis": """
-storage:
-  type: gcs
-  bucket: my-prod-bucket
-  prefix: roleplay-prod/
-  project_id: my-gcp-project
-  credentials_file: /path/to/service-account.json
-  lock:
-    strategy: redis
-    lease_duration_seconds: 30
-    retry_attempts: 5
-    retry_delay_seconds: 0.5
-    redis_host: redis.example.com
-    redis_port: 6379
-    redis_password: ${REDIS_PASSWORD}
-    redis_db: 0
-""",
-    
-    "prod_s3": """
-storage:
-  type: s3
-  bucket: my-prod-bucket
-  prefix: roleplay-prod/
-  region_name: us-west-2
-  lock:
-    strategy: object  # Consider 'redis' for high-contention scenarios
-    lease_duration_seconds: 60
-    retry_attempts: 3
-    retry_delay_seconds: 1.0
-"""
-}
\ No newline at end of file
+def __getattr__(name: str):
+    """Load ``EXAMPLE_CONFIGS`` from storage_factory_examples on first access."""
+    if name == "EXAMPLE_CONFIGS":
+        from .storage_factory_examples import EXAMPLE_CONFIGS
+        return EXAMPLE_CONFIGS
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
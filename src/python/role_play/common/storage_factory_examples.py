@@ -0,0 +1,60 @@
+"""Example storage configurations, loaded on demand via storage_factory.EXAMPLE_CONFIGS."""
+
+# Example YAML configurations for documentation
+EXAMPLE_CONFIGS = {
+    "dev_file": """
+storage:
+  type: file
+  base_dir: ./data
+  lock:
+    strategy: file
+    lease_duration_seconds: 60
+    retry_attempts: 3
+    retry_delay_seconds: 1.0
+""",
+    
+    "dev_gcs": """
+storage:
+  type: gcs
+  bucket: my-dev-bucket
+  prefix: roleplay-dev/
+  project_id: my-gcp-project
+  credentials_file: /path/to/service-account.json
+  lock:
+    strategy: object
+    lease_duration_seconds: 60
+    retry_attempts: 3
+    retry_delay_seconds: 1.0
+""",
+    
+    "prod_gcs_redis": """
+storage:
+  type: gcs
+  bucket: my-prod-bucket
+  prefix: roleplay-prod/
+  project_id: my-gcp-project
+  credentials_file: /path/to/service-account.json
+  lock:
+    strategy: redis
+    lease_duration_seconds: 30
+    retry_attempts: 5
+    retry_delay_seconds: 0.5
+    redis_host: redis.example.com
+    redis_port: 6379
+    redis_password: ${REDIS_PASSWORD}
+    redis_db: 0
+""",
+    
+    "prod_s3": """
+storage:
+  type: s3
+  bucket: my-prod-bucket
+  prefix: roleplay-prod/
+  region_name: us-west-2
+  lock:
+    strategy: object  # Consider 'redis' for high-contention scenarios
+    lease_duration_seconds: 60
+    retry_attempts: 3
+    retry_delay_seconds: 1.0
+"""
+}
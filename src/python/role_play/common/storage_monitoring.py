@@ -2,16 +2,90 @@
 
 import time
 import asyncio
+from array import array
 from contextlib import contextmanager, asynccontextmanager
-from typing import Dict, Any, Optional, Generator, AsyncGenerator
+from typing import Dict, Any, Generator, AsyncGenerator, Iterable, Sequence, Tuple
 from dataclasses import dataclass, field
-from collections import defaultdict, deque
-from asyncio import Lock
+from collections import OrderedDict
 
 from .exceptions import StorageError
 
 
-@dataclass
+# Number of recent samples retained per metric for percentile calculations
+RECENT_SAMPLE_SIZE = 1000
+
+# Percentiles reported in lock metric summaries
+SUMMARY_PERCENTILES = (50, 95, 99)
+
+# Maximum number of (strategy, resource) pairs tracked; least recently used are evicted.
+# Totals are kept separately, so eviction only drops per-resource detail
+_MAX_RESOURCES = 10_000
+
+
+# Prometheus exposition format for export_metrics_for_prometheus
+_PROMETHEUS_TEMPLATE = """\
+# HELP storage_lock_attempts_total Total number of lock acquisition attempts
+# TYPE storage_lock_attempts_total counter
+storage_lock_attempts_total {lock_attempts}
+
+# HELP storage_lock_successes_total Total number of successful lock acquisitions
+# TYPE storage_lock_successes_total counter
+storage_lock_successes_total {lock_successes}
+
+# HELP storage_operations_total Total number of storage operations
+# TYPE storage_operations_total counter
+storage_operations_total {operations}
+
+# HELP storage_errors_total Total number of storage errors
+# TYPE storage_errors_total counter
+storage_errors_total {errors}"""
+
+
+class RingBuffer:
+    """
+    Fixed-size buffer of float samples backed by a preallocated ``array('d')``.
+
+    Once full, new samples overwrite the oldest ones. Samples are stored
+    unboxed, so no per-append allocation happens.
+    """
+
+    __slots__ = ("_buf", "_capacity", "_idx")
+
+    def __init__(self, capacity: int = RECENT_SAMPLE_SIZE):
+        self._buf = array('d', bytes(8 * capacity))
+        self._capacity = capacity
+        self._idx = 0
+
+    def append(self, value: float) -> None:
+        """Store a sample, overwriting the oldest one when full."""
+        self._buf[self._idx % self._capacity] = value
+        self._idx += 1
+
+    def __len__(self) -> int:
+        return min(self._idx, self._capacity)
+
+    def valid(self) -> array:
+        """Return the currently populated samples (unordered once wrapped)."""
+        return self._buf[:len(self)]
+
+
+def _percentiles(samples: Sequence[float], percents: Iterable[int]) -> Dict[int, float]:
+    """Compute linear-interpolated percentiles over the given samples."""
+    if not samples:
+        return {p: 0.0 for p in percents}
+
+    ordered = sorted(samples)
+    last = len(ordered) - 1
+    result = {}
+    for p in percents:
+        rank = last * p / 100
+        lower = int(rank)
+        upper = min(lower + 1, last)
+        result[p] = ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+    return result
+
+
+@dataclass(slots=True)
 class LockMetrics:
     """Metrics for lock operations."""
     acquisition_attempts: int = 0
@@ -23,11 +97,20 @@ class LockMetrics:
     expired_locks: int = 0
     
     # Recent operation times for percentile calculations
-    recent_acquisition_times: deque = field(default_factory=lambda: deque(maxlen=1000))
-    recent_hold_times: deque = field(default_factory=lambda: deque(maxlen=1000))
+    recent_acquisition_times: RingBuffer = field(default_factory=RingBuffer)
+    recent_hold_times: RingBuffer = field(default_factory=RingBuffer)
+
+
+@dataclass(slots=True)
+class LockTotals:
+    """Running lock totals across all resources; unaffected by per-resource eviction."""
+    acquisition_attempts: int = 0
+    acquisition_successes: int = 0
+    acquisition_failures: int = 0
+    total_acquisition_time: float = 0.0
 
 
-@dataclass 
+@dataclass(slots=True)
 class StorageMetrics:
     """Metrics for storage operations."""
     read_operations: int = 0
@@ -67,14 +150,31 @@ class StorageMonitor:
     - Implement alerting on threshold breaches
     - Add dashboard configuration templates
     - Support metric export in multiple formats
+
+    Concurrency: the monitor assumes it is driven from a single event loop.
+    No update awaits between reading and writing a metric, so every update
+    runs to completion without interleaving and needs no lock. Sharing one
+    monitor across threads or event loops is not supported.
     """
 
     def __init__(self):
-        self._lock = Lock()
-        self._lock_metrics: Dict[str, LockMetrics] = defaultdict(LockMetrics)
+        # Keyed by (lock_strategy, resource_name), ordered least to most recently used
+        self._lock_metrics: "OrderedDict[Tuple[str, str], LockMetrics]" = OrderedDict()
+        self._lock_totals = LockTotals()
         self._storage_metrics = StorageMetrics()
         self._start_time = time.time()
 
+    def _get_lock_metrics(self, metric_key: Tuple[str, str]) -> LockMetrics:
+        """Get or create metrics for a key, evicting the least recently used when full."""
+        metrics = self._lock_metrics.get(metric_key)
+        if metrics is None:
+            metrics = self._lock_metrics[metric_key] = LockMetrics()
+            if len(self._lock_metrics) > _MAX_RESOURCES:
+                self._lock_metrics.popitem(last=False)
+        else:
+            self._lock_metrics.move_to_end(metric_key)
+        return metrics
+
     @asynccontextmanager
     async def monitor_lock_acquisition(
         self, 
@@ -91,41 +191,37 @@ class StorageMonitor:
         Yields:
             None
         """
-        metric_key = f"{lock_strategy}:{resource_name}"
-        start_time = time.time()
-        
-        async with self._lock:
-            self._lock_metrics[metric_key].acquisition_attempts += 1
-        
-        success = False
+        metric_key = (lock_strategy, resource_name)
+        start_time = time.perf_counter()
         hold_start_time = None
+        success = False
         
         try:
             yield
+            hold_start_time = time.perf_counter()
             success = True
-            hold_start_time = time.time()
             
         except Exception:
-            async with self._lock:
-                self._lock_metrics[metric_key].acquisition_failures += 1
+            self._get_lock_metrics(metric_key).acquisition_failures += 1
+            self._lock_totals.acquisition_failures += 1
             raise
             
         finally:
-            end_time = time.time()
-            acquisition_time = (hold_start_time or end_time) - start_time
+            end_time = time.perf_counter()
+            metrics = self._get_lock_metrics(metric_key)
+            metrics.acquisition_attempts += 1
+            self._lock_totals.acquisition_attempts += 1
             
-            async with self._lock:
-                metrics = self._lock_metrics[metric_key]
-                
-                if success:
-                    metrics.acquisition_successes += 1
-                    metrics.total_acquisition_time += acquisition_time
-                    metrics.recent_acquisition_times.append(acquisition_time)
-                    
-                    if hold_start_time:
-                        hold_time = end_time - hold_start_time
-                        metrics.total_hold_time += hold_time
-                        metrics.recent_hold_times.append(hold_time)
+            if success:
+                metrics.acquisition_successes += 1
+                acquisition_time = hold_start_time - start_time
+                hold_time = end_time - hold_start_time
+                self._lock_totals.acquisition_successes += 1
+                self._lock_totals.total_acquisition_time += acquisition_time
+                metrics.total_acquisition_time += acquisition_time
+                metrics.recent_acquisition_times.append(acquisition_time)
+                metrics.total_hold_time += hold_time
+                metrics.recent_hold_times.append(hold_time)
 
     @asynccontextmanager 
     async def monitor_storage_operation(
@@ -141,7 +237,7 @@ class StorageMonitor:
         Yields:
             None
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         success = False
         
         try:
@@ -149,39 +245,34 @@ class StorageMonitor:
             success = True
             
         except Exception:
-            async with self._lock:
-                if operation_type == "read":
-                    self._storage_metrics.read_errors += 1
-                elif operation_type == "write":
-                    self._storage_metrics.write_errors += 1
+            if operation_type == "read":
+                self._storage_metrics.read_errors += 1
+            elif operation_type == "write":
+                self._storage_metrics.write_errors += 1
             raise
             
         finally:
-            operation_time = time.time() - start_time
+            operation_time = time.perf_counter() - start_time
             
-            async with self._lock:
-                if success:
-                    if operation_type == "read":
-                        self._storage_metrics.read_operations += 1
-                        self._storage_metrics.total_read_time += operation_time
-                    elif operation_type == "write":
-                        self._storage_metrics.write_operations += 1
-                        self._storage_metrics.total_write_time += operation_time
-                    elif operation_type == "delete":
-                        self._storage_metrics.delete_operations += 1
-                    elif operation_type == "list":
-                        self._storage_metrics.list_operations += 1
+            if success:
+                if operation_type == "read":
+                    self._storage_metrics.read_operations += 1
+                    self._storage_metrics.total_read_time += operation_time
+                elif operation_type == "write":
+                    self._storage_metrics.write_operations += 1
+                    self._storage_metrics.total_write_time += operation_time
+                elif operation_type == "delete":
+                    self._storage_metrics.delete_operations += 1
+                elif operation_type == "list":
+                    self._storage_metrics.list_operations += 1
 
     async def record_connection_error(self, backend_type: str) -> None:
         """Record a connection error for monitoring."""
-        async with self._lock:
-            self._storage_metrics.connection_errors += 1
+        self._storage_metrics.connection_errors += 1
 
     async def record_lock_expiry(self, resource_name: str, lock_strategy: str) -> None:
         """Record a lock expiry event."""
-        metric_key = f"{lock_strategy}:{resource_name}"
-        async with self._lock:
-            self._lock_metrics[metric_key].expired_locks += 1
+        self._get_lock_metrics((lock_strategy, resource_name)).expired_locks += 1
 
     async def get_lock_metrics_summary(self) -> Dict[str, Any]:
         """
@@ -190,34 +281,36 @@ class StorageMonitor:
         Returns:
             dict: Summary of lock performance metrics
         """
-        async with self._lock:
-            total_attempts = sum(m.acquisition_attempts for m in self._lock_metrics.values())
-            total_successes = sum(m.acquisition_successes for m in self._lock_metrics.values())
-            total_failures = sum(m.acquisition_failures for m in self._lock_metrics.values())
-            
-            success_rate = (total_successes / total_attempts * 100) if total_attempts > 0 else 0
-            
-            # Calculate average acquisition time
-            all_acquisition_times = []
-            for metrics in self._lock_metrics.values():
-                all_acquisition_times.extend(list(metrics.recent_acquisition_times))
-            
-            avg_acquisition_time = (
-                sum(all_acquisition_times) / len(all_acquisition_times)
-                if all_acquisition_times else 0
-            )
-            
-            return {
-                "total_attempts": total_attempts,
-                "total_successes": total_successes,
-                "total_failures": total_failures,
-                "success_rate_percent": round(success_rate, 2),
-                "average_acquisition_time_ms": round(avg_acquisition_time * 1000, 2),
-                "active_strategies": list(set(
-                    key.split(':')[0] for key in self._lock_metrics.keys()
-                )),
-                "most_contended_resources": await self._get_most_contended_resources()
-            }
+        totals = self._lock_totals
+        total_attempts = totals.acquisition_attempts
+        total_successes = totals.acquisition_successes
+        total_failures = totals.acquisition_failures
+        
+        success_rate = (total_successes / total_attempts * 100) if total_attempts > 0 else 0
+        
+        # Average from the running totals; only percentiles need the (per-resource) samples
+        avg_acquisition_time = (
+            totals.total_acquisition_time / total_successes if total_successes > 0 else 0
+        )
+        
+        all_acquisition_times = array('d')
+        for metrics in self._lock_metrics.values():
+            all_acquisition_times.extend(metrics.recent_acquisition_times.valid())
+        percentiles = _percentiles(all_acquisition_times, SUMMARY_PERCENTILES)
+        
+        return {
+            "total_attempts": total_attempts,
+            "total_successes": total_successes,
+            "total_failures": total_failures,
+            "success_rate_percent": round(success_rate, 2),
+            "average_acquisition_time_ms": round(avg_acquisition_time * 1000, 2),
+            **{
+                f"p{p}_acquisition_time_ms": round(value * 1000, 2)
+                for p, value in percentiles.items()
+            },
+            "active_strategies": list({strategy for strategy, _ in self._lock_metrics}),
+            "most_contended_resources": await self._get_most_contended_resources()
+        }
 
     async def get_storage_metrics_summary(self) -> Dict[str, Any]:
         """
@@ -226,37 +319,36 @@ class StorageMonitor:
         Returns:
             dict: Summary of storage performance metrics
         """
-        async with self._lock:
-            total_ops = (
-                self._storage_metrics.read_operations +
-                self._storage_metrics.write_operations +
-                self._storage_metrics.delete_operations +
-                self._storage_metrics.list_operations
-            )
-            
-            avg_read_time = (
-                self._storage_metrics.total_read_time / self._storage_metrics.read_operations
-                if self._storage_metrics.read_operations > 0 else 0
-            )
-            
-            avg_write_time = (
-                self._storage_metrics.total_write_time / self._storage_metrics.write_operations
-                if self._storage_metrics.write_operations > 0 else 0
-            )
-            
-            return {
-                "total_operations": total_ops,
-                "read_operations": self._storage_metrics.read_operations,
-                "write_operations": self._storage_metrics.write_operations,
-                "delete_operations": self._storage_metrics.delete_operations,
-                "list_operations": self._storage_metrics.list_operations,
-                "average_read_time_ms": round(avg_read_time * 1000, 2),
-                "average_write_time_ms": round(avg_write_time * 1000, 2),
-                "read_errors": self._storage_metrics.read_errors,
-                "write_errors": self._storage_metrics.write_errors,
-                "connection_errors": self._storage_metrics.connection_errors,
-                "uptime_seconds": round(time.time() - self._start_time, 2)
-            }
+        total_ops = (
+            self._storage_metrics.read_operations +
+            self._storage_metrics.write_operations +
+            self._storage_metrics.delete_operations +
+            self._storage_metrics.list_operations
+        )
+        
+        avg_read_time = (
+            self._storage_metrics.total_read_time / self._storage_metrics.read_operations
+            if self._storage_metrics.read_operations > 0 else 0
+        )
+        
+        avg_write_time = (
+            self._storage_metrics.total_write_time / self._storage_metrics.write_operations
+            if self._storage_metrics.write_operations > 0 else 0
+        )
+        
+        return {
+            "total_operations": total_ops,
+            "read_operations": self._storage_metrics.read_operations,
+            "write_operations": self._storage_metrics.write_operations,
+            "delete_operations": self._storage_metrics.delete_operations,
+            "list_operations": self._storage_metrics.list_operations,
+            "average_read_time_ms": round(avg_read_time * 1000, 2),
+            "average_write_time_ms": round(avg_write_time * 1000, 2),
+            "read_errors": self._storage_metrics.read_errors,
+            "write_errors": self._storage_metrics.write_errors,
+            "connection_errors": self._storage_metrics.connection_errors,
+            "uptime_seconds": round(time.time() - self._start_time, 2)
+        }
 
     async def _get_most_contended_resources(self, limit: int = 5) -> list:
         """Get the most contended resources by attempt count."""
@@ -268,12 +360,12 @@ class StorageMonitor:
         
         return [
             {
-                "resource": key.split(':', 1)[1] if ':' in key else key,
-                "strategy": key.split(':', 1)[0] if ':' in key else "unknown",
+                "resource": resource,
+                "strategy": strategy,
                 "attempts": metrics.acquisition_attempts,
                 "failures": metrics.acquisition_failures
             }
-            for key, metrics in sorted_resources[:limit]
+            for (strategy, resource), metrics in sorted_resources[:limit]
         ]
 
     async def export_metrics_for_prometheus(self) -> str:
@@ -284,45 +376,33 @@ class StorageMonitor:
             str: Metrics in Prometheus exposition format
         """
         # TODO: Implement actual Prometheus metric formatting
-        lock_summary = await self.get_lock_metrics_summary()
-        storage_summary = await self.get_storage_metrics_summary()
-        
-        return f"""
-# HELP storage_lock_attempts_total Total number of lock acquisition attempts
-# TYPE storage_lock_attempts_total counter
-storage_lock_attempts_total {lock_summary['total_attempts']}
-
-# HELP storage_lock_successes_total Total number of successful lock acquisitions
-# TYPE storage_lock_successes_total counter
-storage_lock_successes_total {lock_summary['total_successes']}
-
-# HELP storage_operations_total Total number of storage operations
-# TYPE storage_operations_total counter
-storage_operations_total {storage_summary['total_operations']}
-
-# HELP storage_errors_total Total number of storage errors
-# TYPE storage_errors_total counter
-storage_errors_total {storage_summary['read_errors'] + storage_summary['write_errors']}
-""".strip()
+        storage = self._storage_metrics
+        return _PROMETHEUS_TEMPLATE.format(
+            lock_attempts=self._lock_totals.acquisition_attempts,
+            lock_successes=self._lock_totals.acquisition_successes,
+            operations=(
+                storage.read_operations + storage.write_operations +
+                storage.delete_operations + storage.list_operations
+            ),
+            errors=storage.read_errors + storage.write_errors,
+        )
 
     async def reset_metrics(self) -> None:
         """Reset all metrics (useful for testing)."""
-        async with self._lock:
-            self._lock_metrics.clear()
-            self._storage_metrics = StorageMetrics()
-            self._start_time = time.time()
+        self._lock_metrics.clear()
+        self._lock_totals = LockTotals()
+        self._storage_metrics = StorageMetrics()
+        self._start_time = time.time()
 
 
-# Global monitor instance (singleton pattern)
-_global_monitor: Optional[StorageMonitor] = None
+# Global monitor instance (singleton pattern). Construction does no I/O, so it
+# is created eagerly at import rather than behind a racy first-use check.
+_GLOBAL_MONITOR = StorageMonitor()
 
 
 def get_storage_monitor() -> StorageMonitor:
     """Get the global storage monitor instance."""
-    global _global_monitor
-    if _global_monitor is None:
-        _global_monitor = StorageMonitor()
-    return _global_monitor
+    return _GLOBAL_MONITOR
 
 
 # Decision matrix for when to evolve locking strategy
@@ -4,9 +4,26 @@ Time utilities for consistent datetime handling across the application.
 All functions work with UTC timezone-aware datetimes only.
 """
 
+import re
+from calendar import monthrange
 from datetime import datetime, timezone
 from typing import Optional
 
+_UTC = timezone.utc
+
+# Canonical Zulu form produced by utc_now_isoformat, e.g. 2024-01-01T12:00:00.123456Z
+# (re.ASCII keeps \d from matching non-ASCII digits, which fromisoformat rejects)
+_ISO_Z_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})T(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?Z", re.ASCII
+)
+
+# Range-checked UTC timestamp with either 'Z' or '+00:00' suffix, used for validation
+_VALID_UTC_RE = re.compile(
+    r"(\d{4})-(0[1-9]|1[0-2])-(0[1-9]|[12]\d|3[01])"
+    r"T(?:[01]\d|2[0-3]):[0-5]\d:[0-5]\d(?:\.\d{1,6})?(?:Z|\+00:00)",
+    re.ASCII,
+)
+
 
 def utc_now() -> datetime:
     """Return a timezone-aware datetime in UTC."""
@@ -44,10 +61,21 @@ def parse_utc_datetime(dt_str: str) -> datetime:
     Raises:
         ValueError if the string cannot be parsed or is not UTC.
     """
+    # Fast path for the canonical Zulu form; anything else goes through fromisoformat
+    m = _ISO_Z_RE.fullmatch(dt_str)
+    if m is not None:
+        year, month, day, hour, minute, second, fraction = m.groups()
+        return datetime(
+            int(year), int(month), int(day),
+            int(hour), int(minute), int(second),
+            int(fraction.ljust(6, "0")) if fraction else 0,
+            _UTC,
+        )
+
     if dt_str.endswith("Z"):
         dt_str = dt_str[:-1] + "+00:00"
     dt = datetime.fromisoformat(dt_str)
-    if dt.tzinfo != timezone.utc:
+    if dt.tzinfo != _UTC:
         raise ValueError("Only UTC datetime strings are supported.")
     return dt
 
@@ -55,9 +83,22 @@ def parse_utc_datetime(dt_str: str) -> datetime:
 def is_valid_utc_isoformat(dt_str: str) -> bool:
     """
     Return True if the string is a valid UTC ISO 8601 datetime.
+
+    Accepts exactly what parse_utc_datetime accepts. The common
+    'YYYY-MM-DDTHH:MM:SS[.ffffff]' form with a 'Z' or '+00:00' suffix is
+    checked without parsing; anything else is decided by the parser.
     """
-    try:
-        _ = parse_utc_datetime(dt_str)
-        return True
-    except Exception:
-        return False
\ No newline at end of file
+    if not isinstance(dt_str, str):
+        return False
+    m = _VALID_UTC_RE.fullmatch(dt_str)
+    if m is None:
+        try:
+            parse_utc_datetime(dt_str)
+            return True
+        except ValueError:
+            return False
+    year, month, day = int(m[1]), int(m[2]), int(m[3])
+    if year == 0:
+        return False
+    # The pattern bounds day to 31; only check month length when it could matter
+    return day <= 28 or day <= monthrange(year, month)[1]
\ No newline at end of file
@@ -1,6 +1,30 @@
-"""Evaluator agent module for roleplay session analysis."""
+"""Evaluator agent module for roleplay session analysis.
+
+The evaluation model is read from ``GOOGLE_GENAI_MODEL`` once, when this
+package is first imported; later changes to the environment are not seen.
+"""
+import functools
 import os
+from typing import TYPE_CHECKING, Final
+
+if TYPE_CHECKING:
+    from google.adk.models import BaseLlm
+
+# Use a more capable model for evaluation
+_DEFAULT_MODEL: Final[str] = "gemini-2.5-flash-preview-05-20"
+
+MODEL: Final[str] = os.environ.get("GOOGLE_GENAI_MODEL") or _DEFAULT_MODEL
+
+
+@functools.cache
+def get_llm() -> "BaseLlm":
+    """
+    Return the model instance shared by every evaluator agent.
+
+    ADK resolves a model given by name into a new BaseLlm, with its own API
+    client, each time it is used, so agents share this one to reuse its
+    client and connections across evaluations.
+    """
+    from google.adk.models.registry import LLMRegistry
 
-MODEL = os.getenv("GOOGLE_GENAI_MODEL")
-if not MODEL:
-    MODEL = "gemini-2.5-flash-preview-05-20"  # Use a more capable model for evaluation
+    return LLMRegistry.new_llm(MODEL)
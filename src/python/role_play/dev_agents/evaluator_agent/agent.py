@@ -1,61 +1,98 @@
 """
 Evaluation agent for analyzing roleplay session transcripts and providing feedback.
 """
-import os
-import sys
-from pathlib import Path
-from typing import Dict, Optional, List, Any
-from google.adk.agents import Agent, ParallelAgent, SequentialAgent
-from google.adk.tools import FunctionTool
+from typing import TYPE_CHECKING, Dict, Optional, List, Any
+
+from role_play.chat.models import ChatInfo
 
 from . import MODEL
-from .sub_agents.analysis_agent import create_analysis_agent
-from .sub_agents.summarize_agent import create_summary_report_agent
 
-# Add project root to path; this will break if you run adk web from places OTHER than dev_agents dir
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src" / "python"))
+if TYPE_CHECKING:
+    from google.adk.agents import SequentialAgent
 
-from role_play.chat.models import ChatInfo
 
-evaluator_tools = []
+def create_evaluator_agent(language: str, chat_info: ChatInfo, batched: bool = True) -> "SequentialAgent":
+    """
+    Build the evaluator pipeline: skill analysis followed by a summary report.
 
-def create_evaluator_agent(language: str, chat_info: ChatInfo):
-    analysis_areas = ["clarity", "empathy", "escalation"]
-    analysis_agents = [create_analysis_agent(analysis_area=analysis_areas, chat_info=chat_info) for analysis_areas in analysis_areas]
-    parallel = ParallelAgent(
-        name="parallelize_specialized_analysis",
-        description=f"Create analysis report for participant {chat_info.participant_name} in the areas of [{', '.join(analysis_areas)}] from chat history",
-        sub_agents=analysis_agents
+    With ``batched`` (the default) all areas are assessed by one agent in a
+    single LLM call over the transcript; otherwise each area gets its own
+    agent, run in parallel (e.g. to use different models per area). The
+    per-area prompts share everything up to the area line, so that path
+    relies on the provider's implicit prefix caching for the transcript.
+    """
+    from google.adk.agents import ParallelAgent, SequentialAgent
+    from .model import MultiSkillAssessment
+    from .sub_agents.analysis_agent import (
+        build_shared_instruction,
+        create_analysis_agent,
+        create_batched_analysis_agent,
     )
+    from .sub_agents.summarize_agent import create_summary_report_agent
+
+    analysis_areas = list(MultiSkillAssessment.model_fields)
+    if batched and len(analysis_areas) > 1:
+        analysis = create_batched_analysis_agent(analysis_areas, chat_info)
+    else:
+        shared_instruction = build_shared_instruction(chat_info)
+        analysis_agents = [
+            create_analysis_agent(analysis_area=analysis_area, chat_info=chat_info, shared_instruction=shared_instruction)
+            for analysis_area in analysis_areas
+        ]
+        # ParallelAgent already runs its sub-agents concurrently (asyncio.TaskGroup),
+        # so the analysis stage takes as long as the slowest area, not the sum of all
+        analysis = ParallelAgent(
+            name="parallelize_specialized_analysis",
+            description=f"Create analysis report for participant {chat_info.participant_name} in the areas of [{', '.join(analysis_areas)}] from chat history",
+            sub_agents=analysis_agents
+        )
     summarize_agent = create_summary_report_agent(language=chat_info.chat_language)
 
     return SequentialAgent(
         name="chat_evaluation_agent",
-        sub_agents=[parallel, summarize_agent]
+        sub_agents=[analysis, summarize_agent]
     )
 
-# Export the agent
-agent = create_evaluator_agent("English",
-                               ChatInfo(chat_language="English", chat_session_id="chat_session_2025_06_16_16_46_00",
-                                        scenario_info={
-                "id": "123",
-                "name": "Clinic visit",
-                "description": "routine clinic visit",
-                "compatible_character_count": 1
-            }, char_info={
-                "id":"111",
-                "name": "Jane Smith",
-                "description": "Female, 36 years old, with two dogs and three daughters, light drinker, non-smoker, eats veggies every day."
-            }, goal= "understanding risk for pet sickness from stress", transcript_text="""
+def _build_sample_agent() -> "SequentialAgent":
+    """Build the evaluator agent over a canned session, for use with adk web."""
+    sample_chat_info = ChatInfo(
+        chat_language="English",
+        chat_session_id="chat_session_2025_06_16_16_46_00",
+        scenario_info={
+            "id": "123",
+            "name": "Clinic visit",
+            "description": "routine clinic visit",
+            "compatible_character_count": 1
+        },
+        char_info={
+            "id": "111",
+            "name": "Jane Smith",
+            "description": "Female, 36 years old, with two dogs and three daughters, light drinker, non-smoker, eats veggies every day."
+        },
+        goal="understanding risk for pet sickness from stress",
+        transcript_text="""
 My Trainee: Hi How are you
 Jane Smith: Hi Doctor I have a question for you about my pet cat. He kept biting his tail.
 My Trainee: He might be under stress, let me check on him.
 Jane Smith: (holds cat from carrier and hands to doctor)
 My Trainee: ok let me take a look at him. Yes, the tail has lots of bite marks.
-            """, participant_name="My Trainee"))
+            """,
+        participant_name="My Trainee"
+    )
+    return create_evaluator_agent("English", sample_chat_info)
+
+
+# Exported agent names, built on first access so importing this module stays cheap
+_LAZY_AGENTS = {"agent", "root_agent"}
+
 
-root_agent = agent
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_AGENTS:
+        sample_agent = _build_sample_agent()
+        for agent_name in _LAZY_AGENTS:
+            globals()[agent_name] = sample_agent
+        return sample_agent
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # --- Main block for verification ---
@@ -15,6 +15,7 @@
 
 """Callback functions for FOMC Research Agent."""
 
+import asyncio
 import logging
 import time
 
@@ -30,12 +31,15 @@ RATE_LIMIT_SECS = 60
 RPM_QUOTA = 1000
 
 
-def rate_limit_callback(
+async def rate_limit_callback(
     callback_context: CallbackContext, llm_request: LlmRequest
 ) -> None:
     # pylint: disable=unused-argument
     """Callback function that implements a query rate limit.
 
+    Async so that waiting out the quota yields to the event loop instead of
+    blocking every other agent (e.g. parallel analysis agents) with it.
+
     Args:
       callback_context: A CallbackContext object representing the active
               callback context.
@@ -66,7 +70,7 @@ def rate_limit_callback(
         delay = RATE_LIMIT_SECS - elapsed_secs + 1
         if delay > 0:
             logger.debug("Sleeping for %i seconds", delay)
-            time.sleep(delay)
+            await asyncio.sleep(delay)
         callback_context.state["timer_start"] = now
         callback_context.state["request_count"] = 1
     else:
@@ -5,22 +5,20 @@ These models enforce a consistent, structured data format for communication betw
 the evaluation agents and for storing the final results.
 """
 
-import sys
-from pathlib import Path
-from enum import Enum
-from typing import List, Optional
+import functools
+import json
+from typing import Any, List, Literal, Optional
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, TypeAdapter
 
-# Add project root to path; this will break if you run adk web from places OTHER than dev_agents dir
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src" / "python"))
+# Skill assessment scoring levels
+Score = Literal["low", "med", "high"]
 
-class Score(Enum):
-    """Enumeration for skill assessment scoring."""
-    low = "low"
-    med = "med"
-    high = "high"
+# Shared config for LLM-produced reports: unknown keys from the model are dropped,
+# instances are immutable once validated (post-hoc fixups such as overall_score
+# go through model_copy), and field descriptions for the prompt schema come
+# from attribute docstrings
+_REPORT_MODEL_CONFIG = ConfigDict(extra="ignore", frozen=True, use_attribute_docstrings=True)
 
 
 class SpecializedAssessment(BaseModel):
@@ -28,29 +26,39 @@ class SpecializedAssessment(BaseModel):
     Defines the structured output for a specialized review agent (e.g., Empathy, Clarity).
     Each agent instance will produce one of these objects.
     """
-    chat_session_id: str = Field(description="The unique identifier for the chat session being evaluated.")
-    assessment_area: str = Field(
-        description="The specific skill or area being assessed, e.g., 'empathy'."
-    )
-    score: Score = Field(
-        description="A score for this area. Valid values are low, med, and high. "
-    )
-    confidence: Score = Field(
-        description="How confident you are in the score you give. Valid values are high, med, and low. High means you are very confident about your score, med means you are confident, low means you are NOT confident."
-    )
-    positive_points: List[str] = Field(
-        description="List of observed strengths in localized language."
-    )
-    improvement_areas: List[str] = Field(
-        description="List of areas needing improvement in localized language."
-    )
-    specific_suggestions: List[str] = Field(
-        description="Concrete, actionable suggestions for the user in localized language."
-    )
-    notes: Optional[str] = Field(
-        default=None,
-        description="MUST be provided if confidence is Medium or Low, explaining the reason for the uncertainty."
-    )
+    model_config = _REPORT_MODEL_CONFIG
+
+    chat_session_id: str
+    """The unique identifier for the chat session being evaluated."""
+    assessment_area: str
+    """The specific skill or area being assessed, e.g., 'empathy'."""
+    score: Score
+    """A score for this area. Valid values are low, med, and high."""
+    confidence: Score
+    """How confident you are in the score you give. Valid values are high, med, and low. High means you are very confident about your score, med means you are confident, low means you are NOT confident."""
+    positive_points: List[str]
+    """List of observed strengths in localized language."""
+    improvement_areas: List[str]
+    """List of areas needing improvement in localized language."""
+    specific_suggestions: List[str]
+    """Concrete, actionable suggestions for the user in localized language."""
+    notes: Optional[str] = None
+    """MUST be provided if confidence is Medium or Low, explaining the reason for the uncertainty."""
+
+
+class MultiSkillAssessment(BaseModel):
+    """
+    Structured output for a single agent that assesses every skill area in one
+    pass. Field names are the analysis areas.
+    """
+    model_config = _REPORT_MODEL_CONFIG
+
+    clarity: SpecializedAssessment
+    """Assessment for the clarity area."""
+    empathy: SpecializedAssessment
+    """Assessment for the empathy area."""
+    escalation: SpecializedAssessment
+    """Assessment for the escalation area."""
 
 
 class FinalReviewReport(BaseModel):
@@ -58,29 +66,37 @@ class FinalReviewReport(BaseModel):
     Defines the structure for the final, consolidated review report that is
     synthesized by the ReviewSummarizerAgent and stored.
     """
+    model_config = _REPORT_MODEL_CONFIG
+
     #user_id: str = Field(description="The unique identifier for the user.")
     #scenario_id: str = Field(description="The unique identifier for the scenario.")
-    chat_session_id: str = Field(description="The unique identifier for the chat session being evaluated.")
-    overall_score: float = Field(
-        description="Aggregated and normalized score from all reviewers, ranging from 0.0 to 1.0."
-    )
-    human_review_recommended: bool = Field(
-        description="True if all specialized reviewers reported low confidence, flagging this session for manual review."
-    )
-    overall_assessment: str = Field(
-        description="A holistic, narrative summary of the user's performance in localized language."
-    )
-    key_strengths_demonstrated: List[str] = Field(
-        description="A synthesized list of key strengths from all assessments, in localized language."
-    )
-    key_areas_for_development: List[str] = Field(
-        description="A synthesized list of key areas for development from all assessments, in localized language."
-    )
-    actionable_next_steps: List[str] = Field(
-        description="A list of 3-5 concrete, actionable steps for the user to take next, in localized language."
-    )
-    progress_notes_from_past_feedback: str = Field(
-        description="Notes on the user's progress or recurring themes when compared to past feedback, in localized language."
-    )
-    area_assessments: Optional[List[SpecializedAssessment]] = Field(description="List of specialized assessments.", default=[])
+    chat_session_id: str
+    """The unique identifier for the chat session being evaluated."""
+    overall_score: float
+    """Aggregated and normalized score from all reviewers, ranging from 0.0 to 1.0."""
+    human_review_recommended: bool
+    """True if all specialized reviewers reported low confidence, flagging this session for manual review."""
+    overall_assessment: str
+    """A holistic, narrative summary of the user's performance in localized language."""
+    key_strengths_demonstrated: List[str]
+    """A synthesized list of key strengths from all assessments, in localized language."""
+    key_areas_for_development: List[str]
+    """A synthesized list of key areas for development from all assessments, in localized language."""
+    actionable_next_steps: List[str]
+    """A list of 3-5 concrete, actionable steps for the user to take next, in localized language."""
+    progress_notes_from_past_feedback: str
+    """Notes on the user's progress or recurring themes when compared to past feedback, in localized language."""
+    area_assessments: Optional[List[SpecializedAssessment]] = []
+    """List of specialized assessments."""
+
 
+@functools.lru_cache(maxsize=None)
+def model_schema_json(model: Any) -> str:
+    """
+    Return the compact JSON schema of ``model`` for embedding in prompts, cached per type.
+
+    Goes through a TypeAdapter so container types such as
+    ``List[SpecializedAssessment]`` are supported as well as model classes.
+    """
+    # Compact separators and raw UTF-8 keep the prompt as few tokens as possible
+    return json.dumps(TypeAdapter(model).json_schema(), separators=(",", ":"), ensure_ascii=False)
@@ -1,41 +1,88 @@
-import sys
-from google.adk.agents import Agent, LlmAgent
-from pathlib import Path
+import functools
+from collections import ChainMap
+from typing import Optional, Sequence
+from google.adk.agents import Agent
 
-from .. import MODEL
+from role_play.chat.models import ChatInfo
+
+from .. import get_llm
 from ..library.callback import rate_limit_callback
-from ..model import SpecializedAssessment
+from ..model import MultiSkillAssessment, SpecializedAssessment, model_schema_json
 
-# Add project root to path; this will break if you run adk web from places OTHER than dev_agents dir
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src" / "python"))
+# Built once at import and reused by every analysis agent in the fanout
+_SCHEMA_JSON = model_schema_json(SpecializedAssessment)
+_MULTI_SCHEMA_JSON = model_schema_json(MultiSkillAssessment)
 
-from role_play.chat.models import ChatInfo
+_SINGLE_AREA_TASK = "You will be asked to analyze how the trainee performed in one specific area."
+_MULTI_AREA_TASK = "You will be asked to analyze how the trainee performed in several areas, giving one assessment per area."
 
 
-def create_analysis_agent(analysis_area:str, chat_info=ChatInfo) -> Agent:
-    instruction = f"""
+# Session-independent part of the analysis instruction
+_PREFIX_TEMPLATE = """
     You are an expert communications and soft skills coach. 
-    You are looking at the chat history between your trainee named "{chat_info.participant_name}" 
-    and an actor playing the character {chat_info.char_info} 
-    for scenario {chat_info.scenario_info.description}
-    with the goal of {chat_info.goal}. 
-
-    Here is the chat transcription in {chat_info.chat_language}, where participant is {chat_info.participant_name}: 
-    {chat_info.transcript_text}
+    You are looking at the chat history between your trainee and an actor playing a character in a scenario.
 
-    Provide analysis for how {chat_info.participant_name} performed in the area of {analysis_area}. 
+    {task}
     Provide evidence such as quote from the conversation to support the evaluation; 
     For improvement areas give example in contrast to the quote, in the form of "can say ... instead of <quote from conversation>".
 
-    respond in JSON format {SpecializedAssessment.model_json_schema()}
-    use {chat_info.chat_session_id} as chat_session_id field in your response.
+    respond in JSON format {schema}
 
-    where positive_points, improvement_areas, specific_suggestions SHOULD be written in {chat_info.chat_language},
+    where positive_points, improvement_areas, specific_suggestions SHOULD be written in {chat_language},
     while other fields MUST be written in English only.    
+"""
+
+
+# Final line naming the area(s) to assess; kept last so fanout prompts share a prefix
+_AREA_TEMPLATE = """
+    Provide analysis for how {participant_name} performed in the area of {analysis_area}.
+            """
+_AREAS_TEMPLATE = """
+    Provide analysis for how {participant_name} performed in each of the areas {analysis_areas}.
             """
+
+
+@functools.lru_cache(maxsize=16)
+def _instruction_prefix(chat_language: str, batched: bool = False) -> str:
+    """Session-independent part of the analysis instruction, cached per language and mode."""
+    task, schema = (_MULTI_AREA_TASK, _MULTI_SCHEMA_JSON) if batched else (_SINGLE_AREA_TASK, _SCHEMA_JSON)
+    return _PREFIX_TEMPLATE.format_map({"task": task, "schema": schema, "chat_language": chat_language})
+
+
+# Per-session part of the analysis instruction, filled from ChatInfo fields
+_SESSION_TEMPLATE = """
+    The trainee is named "{participant_name}" 
+    and the actor plays the character {char_info} 
+    for scenario {scenario_description}
+    with the goal of {goal}. 
+    use {chat_session_id} as chat_session_id field in your response.
+
+    Here is the chat transcription in {chat_language}, where participant is {participant_name}: 
+    {transcript_text}
+"""
+
+
+def build_shared_instruction(chat_info: ChatInfo, batched: bool = False) -> str:
+    """
+    Build the instruction text shared by every analysis area of a session.
+
+    Everything except the analysis area goes here, so the prompts sent by the
+    parallel analysis agents share one byte-identical prefix that the model
+    provider can cache.
+    """
+    fields = ChainMap({"scenario_description": chat_info.scenario_info.description}, chat_info.__dict__)
+    return _instruction_prefix(chat_info.chat_language, batched) + _SESSION_TEMPLATE.format_map(fields)
+
+
+def create_analysis_agent(analysis_area:str, chat_info=ChatInfo, shared_instruction: Optional[str] = None) -> Agent:
+    if shared_instruction is None:
+        shared_instruction = build_shared_instruction(chat_info)
+    # Keep the area last so only the tail differs between the fanout agents
+    instruction = shared_instruction + _AREA_TEMPLATE.format_map(
+        {"participant_name": chat_info.participant_name, "analysis_area": analysis_area}
+    )
     return Agent(
-        model=MODEL,
+        model=get_llm(),
         name="chat_history_analysis",
         description=f"Analyze Chat History and provide feedback in area of {analysis_area}",
         instruction=instruction,
@@ -45,3 +92,25 @@ def create_analysis_agent(analysis_area:str, chat_info=ChatInfo) -> Agent:
         output_key=f"report_{analysis_area}"
         #before_model_callback=rate_limit_callback,
     )
+
+
+def create_batched_analysis_agent(analysis_areas: Sequence[str], chat_info: ChatInfo) -> Agent:
+    """
+    Create one agent that assesses all ``analysis_areas`` in a single LLM call.
+
+    The transcript is sent once instead of once per area; the areas must match
+    the fields of MultiSkillAssessment.
+    """
+    instruction = build_shared_instruction(chat_info, batched=True) + _AREAS_TEMPLATE.format_map(
+        {"participant_name": chat_info.participant_name, "analysis_areas": ", ".join(analysis_areas)}
+    )
+    return Agent(
+        model=get_llm(),
+        name="chat_history_batched_analysis",
+        description=f"Analyze Chat History and provide feedback in areas of [{', '.join(analysis_areas)}]",
+        instruction=instruction,
+        output_schema=MultiSkillAssessment,
+        disallow_transfer_to_parent=True,
+        disallow_transfer_to_peers=True,
+        output_key="report_areas"
+    )
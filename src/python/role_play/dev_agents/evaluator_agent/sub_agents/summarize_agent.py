@@ -12,31 +12,82 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-"""Summarize the content of the FOMC meeting transcript."""
-import copy
+"""Summary report agent that merges per-area assessments into a FinalReviewReport."""
+import functools
 import json
+import re
 
-from google.adk.agents import Agent, LlmAgent
+from google.adk.agents import Agent
 from google.adk.agents.callback_context import CallbackContext
 from google.adk.models import LlmRequest, LlmResponse
 from google.genai import types
+from pydantic import ValidationError
 
-from .. import MODEL
+from .. import get_llm
 from ..library.callback import rate_limit_callback
-from ..model import FinalReviewReport, SpecializedAssessment, Score
-from typing import Optional
+from ..model import FinalReviewReport, SpecializedAssessment, model_schema_json
+from typing import Iterable, Optional
 
-def create_summary_report_agent(language:str) -> Agent:
-    instruction = f"""
+# Built once at import instead of on every summary agent construction
+_FINAL_SCHEMA_JSON = model_schema_json(FinalReviewReport)
+
+_SUMMARY_TEMPLATE = """
 You are an expert communications and soft skills coach, you are reviewing analysis for a chat session and giving a summary as a JSON object the following format
 
-{FinalReviewReport.model_json_schema()}
+{schema}
 
 Please make sure to return values of overall_assessment, key_strengths_demonstrated, key_areas_for_development, actionable_next_steps fields written in {language}.
     """
 
+# Points per assessment score, out of _MAX_SCORE_POINTS
+_SCORE_POINTS = {"low": 1, "med": 2, "high": 3}
+_MAX_SCORE_POINTS = 3
+
+def _overall_score(assessments: Iterable[SpecializedAssessment]) -> float:
+    """
+    Aggregate area scores: low means 1 out of 3 possible points, med means 2 out of 3, high means 3 out of 3.
+    The overall score is the points earned divided by the total possible points.
+    """
+    scores = [assessment.score for assessment in assessments]
+    return sum(_SCORE_POINTS[score] for score in scores) / (_MAX_SCORE_POINTS * len(scores))
+
+# Trailing commas are the most common way model JSON drifts from strict JSON. Strings
+# are matched as whole tokens first, so commas and brackets inside them are kept.
+_STRING_OR_TRAILING_COMMA = re.compile(r'"(?:[^"\\]|\\.)*"|,(\s*[}\]])', re.DOTALL)
+
+
+def _drop_trailing_comma(match: re.Match) -> str:
+    """Keeps a matched string as is and drops the comma of a trailing-comma match."""
+    closing = match.group(1)
+    return match.group(0) if closing is None else closing
+
+
+_JSON_DECODER = json.JSONDecoder()
+
+
+def _parse_final_report(text: str) -> FinalReviewReport:
+    """
+    Validate model JSON, retrying once without code fences and trailing commas.
+    The retry decodes only the first JSON object, so trailing commentary is ignored.
+    """
+    try:
+        return FinalReviewReport.model_validate_json(text)
+    except ValidationError:
+        pass
+    cleaned = text.removeprefix("```json").removeprefix("```").removesuffix("```")
+    data, _ = _JSON_DECODER.raw_decode(_STRING_OR_TRAILING_COMMA.sub(_drop_trailing_comma, cleaned).lstrip())
+    return FinalReviewReport.model_validate(data)
+
+@functools.lru_cache(maxsize=8)
+def _summary_instruction(language: str) -> str:
+    return _SUMMARY_TEMPLATE.format_map({"schema": _FINAL_SCHEMA_JSON, "language": language})
+
+def create_summary_report_agent(language:str) -> Agent:
+    # The Agent itself is not cached: ADK binds each agent to a single parent
+    instruction = _summary_instruction(language)
+
     return Agent(
-        model=MODEL,
+        model=get_llm(),
         name="summarize_report_agent",
         description="Summarize the area specific analysis reports into one coherent report.",
         instruction=instruction,
@@ -57,40 +108,32 @@ def report_storage_callback(
     store individual reports from the state into final report object?
     Also need to do majority voting on the individual scores
     """
-    original_text = ""
-    if (llm_response.content is not None) and (llm_response.content.parts is not None) and ( len(llm_response.content.parts) > 0):
-        # now check if part 1 is text
-        if (llm_response.content.parts[0].text is not None) and (len(llm_response.content.parts[0].text.strip()) > 0):
-            original_text = llm_response.content.parts[0].text.strip()
+    # When streaming, only the final aggregated response carries the full JSON
+    if llm_response.partial:
+        return None
+
+    content = llm_response.content
+    parts = content.parts if content is not None else None
+    original_text = (parts[0].text or "").strip() if parts else ""
 
     # nothing to modify
-    if len(original_text) == 0:
+    if not original_text:
         return None
 
     try:
-        final_report = FinalReviewReport(**json.loads(original_text))
-        final_report.overall_score = -1.0
+        final_report = _parse_final_report(original_text)
 
         if (final_report.area_assessments is None) or (len(final_report.area_assessments) == 0):
             # need to grab the individual assessments and fill them in here
             print(f"No assessments found in final report, need to backfill from state")
             # TODO look in callback_context.state for all items key with report_* and convert them into SpecializedAssessment one by one
 
-        # calculate score via majority voting; low means 1 out of 3 possible points, med means 2 out of 3, high means 3 out of 3
-        # we loop through all reports and add up all the scores and divide by the total possible points then that's the overall score
-        score_map = {Score.low: (1,3), Score.med: (2,3), Score.high: (3,3)}
-        score_part = 0
-        score_denominator = 0
-        for report in final_report.area_assessments:
-            p, d = score_map[report.score]
-            score_part += p
-            score_denominator += d
-
-        final_report.overall_score = score_part / score_denominator
+        # reports are frozen, so the recomputed score goes into a copy
+        final_report = final_report.model_copy(update={"overall_score": _overall_score(final_report.area_assessments)})
 
         updated_final_report = final_report.model_dump_json()
-        modified_parts = [copy.deepcopy(part) for part in llm_response.content.parts]
-        modified_parts[0].text = updated_final_report
+        # only the first part changes; the rest are reused as-is
+        modified_parts = [parts[0].model_copy(update={"text": updated_final_report}), *parts[1:]]
 
         new_response = LlmResponse(
             content=types.Content(role="model", parts=modified_parts),
@@ -1,16 +1,15 @@
 """
 Development agent for adk web and configuration export for production.
 """
+import asyncio
+import functools
 import os
-import sys
 import logging
-from pathlib import Path
 from typing import Dict, Optional
 from google.adk.agents import Agent
+from google.adk.models import BaseLlm
+from google.adk.models.registry import LLMRegistry
 
-# Add project root to path
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent.parent
-sys.path.insert(0, str(PROJECT_ROOT / "src" / "python"))
 DEFAULT_MODEL = "gemini-2.5-flash" # Set a reasonable default
 AGENT_MODEL = os.getenv("ADK_MODEL", DEFAULT_MODEL) # <-- Read from env
 
@@ -49,6 +48,54 @@ agent = root_agent
 
 # --- Configuration Export for Production ---
 
+# Display names for supported language codes
+LANGUAGE_NAMES: Dict[str, str] = {
+    "en": "English",
+    "zh-TW": "Traditional Chinese",
+    "ja": "Japanese",
+}
+
+# Production-focused prompt: Combines character, scenario, and language instructions
+PROD_PROMPT_TEMPLATE = """{system_prompt}
+
+**Current Scenario:**
+{description}
+
+**Roleplay Instructions:**
+-   **Stay fully in character.** Do NOT break character or mention you are an AI.
+-   Respond naturally based on your character's personality and the scenario.
+-   **IMPORTANT: Respond in {language_name} language as specified by your character and scenario.**
+-   Engage with the user's messages within the roleplay context.
+"""
+
+# Appended verbatim for scripted sessions; {script_data} is left for ADK to
+# fill from state[script_data] when the instruction is rendered
+SCRIPTED_PROMPT_SUFFIX = """
+You are improvising based on "character" part of the script below, DO NOT say the lines in "participant" part. 
+Try to steer conversation to follow the script. 
+However when you are unable to steer the user back, please respond with "STOP". If you feel you can continue to improvise after the script end, please continue.
+
+Here is the script:
+{script_data}
+"""
+
+@functools.lru_cache(maxsize=8)
+def _shared_llm(agent_model: str) -> BaseLlm:
+    """One model instance per model name, so every chat turn reuses its API client and connections."""
+    return LLMRegistry.new_llm(agent_model)
+
+@functools.lru_cache(maxsize=512)
+def _build_prod_prompt(system_prompt: str, description: str, language_name: str, scripted: bool) -> str:
+    """Assembles the production instruction; keyed on resolved text so resource edits are picked up."""
+    prod_prompt = PROD_PROMPT_TEMPLATE.format_map({
+        "system_prompt": system_prompt,
+        "description": description,
+        "language_name": language_name,
+    })
+    if scripted:
+        prod_prompt += SCRIPTED_PROMPT_SUFFIX
+    return prod_prompt
+
 async def get_production_agent(character_id: str, scenario_id: str, language: str = "en", scripted: bool = False, agent_model: str = AGENT_MODEL, resource_loader=None) -> Optional[Agent]:
     """
     Creates a production-ready RolePlayAgent for a specific
@@ -74,65 +121,37 @@ async def get_production_agent(character_id: str, scenario_id: str, language: st
             logger.info(f"Using dependency-injected ResourceLoader from server")
         except ImportError:
             # Last resort: Use the fallback FileStorage ResourceLoader 
-            from .tools import resource_loader as fallback_loader
-            resource_loader = fallback_loader
+            from .tools import get_dev_resource_loader
+            resource_loader = get_dev_resource_loader()
             logger.warning(f"Using fallback FileStorage ResourceLoader (dev only)")
     else:
         logger.info(f"Creating agent with {type(resource_loader).__name__}")
     
-    # Use await since resource_loader methods are async
-    character = await resource_loader.get_character_by_id(character_id, language)
-    scenario = await resource_loader.get_scenario_by_id(scenario_id, language)
+    # The two lookups are independent, so fetch them concurrently
+    character, scenario = await asyncio.gather(
+        resource_loader.get_character_by_id(character_id, language),
+        resource_loader.get_scenario_by_id(scenario_id, language),
+    )
 
     if not character or not scenario:
         return None
 
-    # Get language display name
-    language_names = {
-        "en": "English",
-        "zh-TW": "Traditional Chinese",
-        "ja": "Japanese"
-    }
-    language_name = language_names.get(language, "English")
-
-    scripted_prompt = None
-    if scripted:
-        # we store the script in state[script_data], should be able to retrive it using {script_data} in the prompt
-        scripted_prompt = """
-You are improvising based on "character" part of the script below, DO NOT say the lines in "participant" part. 
-Try to steer conversation to follow the script. 
-However when you are unable to steer the user back, please respond with "STOP". If you feel you can continue to improvise after the script end, please continue.
-
-Here is the script:
-{script_data}
-"""
-
-    # Production-focused prompt: Combines character, scenario, and language instructions
-    prod_prompt = f"""{character.get("system_prompt", "You are a helpful assistant.")}
-
-**Current Scenario:**
-{scenario.get("description", "No specific scenario description.")}
-
-**Roleplay Instructions:**
--   **Stay fully in character.** Do NOT break character or mention you are an AI.
--   Respond naturally based on your character's personality and the scenario.
--   **IMPORTANT: Respond in {language_name} language as specified by your character and scenario.**
--   Engage with the user's messages within the roleplay context.
-"""
-    if scripted_prompt is not None:
-        prod_prompt += scripted_prompt
+    prod_prompt = _build_prod_prompt(
+        character.get("system_prompt", "You are a helpful assistant."),
+        scenario.get("description", "No specific scenario description."),
+        LANGUAGE_NAMES.get(language, "English"),
+        scripted,
+    )
     # Create and return the configured agent
     return RolePlayAgent(
         name=f"roleplay_{character_id}_{scenario_id}",
-        model=agent_model,
+        model=_shared_llm(agent_model),
         description=f"Roleplay agent for {character.get('name', 'Unknown Character')} in {scenario.get('name', 'Unknown Scenario')}",
         instruction=prod_prompt
     )
 
 # --- Main block for verification ---
 if __name__ == "__main__":
-    import asyncio
-
     async def test_module():
         print("Roleplay Development Agent Module")
         print(f"Agent Name: {root_agent.name}")
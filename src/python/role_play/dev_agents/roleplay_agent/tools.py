@@ -2,53 +2,91 @@
 Tools for the development agent, primarily for exploring
 scenarios and characters within the adk web environment.
 """
-import sys
+import functools
+from collections import OrderedDict
 from pathlib import Path
 from typing import List, Dict, Optional
 
 from google.adk.tools import FunctionTool
 
-# Add project root to path to find ContentLoader
-PROJECT_ROOT = Path(__file__).parent.parent.parent.parent.parent.parent
-#sys.path.insert(0, str(PROJECT_ROOT / "src" / "python"))
-resource_loader = None
+from role_play.common.resource_loader import ResourceLoader
+from role_play.common.storage import FileStorageConfig
+from role_play.common.storage_factory import create_storage_backend
 
-try:
-    from role_play.common.resource_loader import ResourceLoader
-    from role_play.common.storage import FileStorageConfig
-    from role_play.common.storage_factory import create_storage_backend
-    from role_play.server.config import DevelopmentConfig
+# Project root, used to locate the dev data directory
+PROJECT_ROOT = Path(__file__).parents[5]
+
+# Number of rendered listings kept per listing tool
+_LISTING_CACHE_SIZE = 64
+
+@functools.cache
+def get_dev_resource_loader() -> ResourceLoader:
+    """Creates the file-storage ResourceLoader on first use rather than at import."""
     file_storage_config = FileStorageConfig(base_dir=f"{PROJECT_ROOT}/data")
     storage = create_storage_backend(file_storage_config) # default to DEV with file storage
-    resource_loader = ResourceLoader(storage) # this should be loading from {project_root}/data/resources
+    return ResourceLoader(storage) # this should be loading from {project_root}/data/resources
 
-except ImportError:
-    raise RuntimeError(f"Unable to import necessary storage config")
+def _cache_listing(func):
+    """
+    Caches a listing's rendered text per call arguments, keeping the most recently used
+    _LISTING_CACHE_SIZE entries. The dev loader's resources don't change while adk web runs;
+    cache_clear() resets it. Empty listings (None) aren't cached, so IDs the model makes up
+    don't fill the cache and resources added later still show up.
+    """
+    rendered: "OrderedDict[tuple, str]" = OrderedDict()
 
-async def list_scenarios() -> str:
-    """Lists all available roleplay scenarios by name and ID."""
-    scenarios = await resource_loader.get_scenarios()
+    @functools.wraps(func)
+    async def wrapper(*args) -> Optional[str]:
+        result = rendered.get(args)
+        if result is not None:
+            rendered.move_to_end(args)
+            return result
+        result = await func(*args)
+        if result is not None:
+            rendered[args] = result
+            if len(rendered) > _LISTING_CACHE_SIZE:
+                rendered.popitem(last=False)
+        return result
+
+    wrapper.cache_clear = rendered.clear
+    return wrapper
+
+@_cache_listing
+async def _render_scenarios() -> Optional[str]:
+    scenarios = await get_dev_resource_loader().get_scenarios()
     if not scenarios:
-        return "No scenarios found."
+        return None
     return "\n".join([f"- {s['name']} (ID: {s['id']})" for s in scenarios])
 
-async def list_scripts() -> str:
-    """Lists all available roleplay scripts by goal and ID, and corresponding scenario and character."""
-    scripts = await resource_loader.get_scripts()
+@_cache_listing
+async def _render_scripts() -> Optional[str]:
+    scripts = await get_dev_resource_loader().get_scripts()
     if not scripts:
-        return "No scripts found."
+        return None
     return "\n".join([f"- id: {s['id']}\tgoal: {s['goal']}\tscenario_id: {s['scenario_id']}\tchar_id: {s['character_id']}" for s in scripts])
 
-async def list_characters(scenario_id: str) -> str:
-    """Lists characters available for a specific scenario ID."""
-    characters = await resource_loader.get_scenario_characters(scenario_id)
+@_cache_listing
+async def _render_characters(scenario_id: str) -> Optional[str]:
+    characters = await get_dev_resource_loader().get_scenario_characters(scenario_id)
     if not characters:
-        return f"No characters found for scenario '{scenario_id}' or scenario ID is invalid."
+        return None
     return "\n".join([f"- {c['name']} (ID: {c['id']})" for c in characters])
 
+async def list_scenarios() -> str:
+    """Lists all available roleplay scenarios by name and ID."""
+    return await _render_scenarios() or "No scenarios found."
+
+async def list_scripts() -> str:
+    """Lists all available roleplay scripts by goal and ID, and corresponding scenario and character."""
+    return await _render_scripts() or "No scripts found."
+
+async def list_characters(scenario_id: str) -> str:
+    """Lists characters available for a specific scenario ID."""
+    return await _render_characters(scenario_id) or f"No characters found for scenario '{scenario_id}' or scenario ID is invalid."
+
 async def get_character_prompt(character_id: str) -> str:
     """Gets the system prompt for a specific character ID."""
-    character = await resource_loader.get_character_by_id(character_id)
+    character = await get_dev_resource_loader().get_character_by_id(character_id)
     if not character:
         return f"Character '{character_id}' not found."
     return character.get("system_prompt", "No system prompt defined for this character.")
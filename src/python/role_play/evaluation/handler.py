@@ -1,16 +1,16 @@
 """Evaluation handler for session analysis and export."""
-import json
+import asyncio
 import logging
 from typing import List, Annotated, Optional, Dict, Any
 
 from fastapi import HTTPException, Depends, APIRouter
-from fastapi.responses import PlainTextResponse
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai.types import Content, Part
 from pydantic import BaseModel
 
 from ..chat.chat_logger import ChatLogger
+from ..common import json_utils
 from ..common.models import BaseResponse, User
 from ..common.time_utils import utc_now_isoformat
 import uuid
@@ -23,19 +23,8 @@ from ..common.storage import StorageBackend
 
 logger = logging.getLogger(__name__)
 
-class SessionSummary(BaseResponse):
-    """Summary of a session available for evaluation."""
-    session_id: str
-    participant: str
-    scenario: str
-    character: str
-    message_count: int
-    started: str
-    storage_path: str
-
-class SessionListResponse(BaseResponse):
-    """Response containing list of sessions for evaluation."""
-    sessions: List[SessionSummary]
+# Upper bound on concurrent storage reads when listing reports
+_MAX_CONCURRENT_READS = 32
 
 class EvaluationRequest(BaseModel):
     """Request to evaluate a session."""
@@ -102,7 +91,7 @@ class EvaluationHandler(BaseHandler):
             for i, key in enumerate(sorted_keys):
                 try:
                     report_json = await storage.read(key)
-                    report_data = json.loads(report_json)
+                    report_data = json_utils.loads(report_json)
                     
                     # Extract report ID from the path
                     report_id = key.split('/')[-1]
@@ -142,31 +131,55 @@ class EvaluationHandler(BaseHandler):
             reports_prefix = f"users/{user_id}/eval_reports/{session_id}/"
             report_keys = await storage.list_keys(reports_prefix)
             
-            reports = []
-            for key in sorted(report_keys, reverse=True):  # Newest first
-                try:
-                    report_json = await storage.read(key)
-                    report_data = json.loads(report_json)
-                    
-                    # Extract report ID from the path
-                    report_id = key.split('/')[-1]
-                    
-                    reports.append(EvaluationReportSummary(
-                        report_id=report_id,
-                        chat_session_id=session_id,
-                        created_at=report_data.get('created_at', ''),
-                        evaluation_type=report_data.get('evaluation_type', 'comprehensive')
-                    ))
-                except Exception as e:
-                    logger.error(f"Failed to read report {key}: {e}")
-                    continue
-            
-            return reports
+            keys = sorted(report_keys, reverse=True)  # Newest first
+            semaphore = asyncio.Semaphore(_MAX_CONCURRENT_READS)
+
+            async def read_bounded(key: str) -> str:
+                async with semaphore:
+                    return await storage.read(key)
+
+            # Reads are independent, so issue them concurrently; results come
+            # back in key order, failures as exception objects.
+            results = await asyncio.gather(
+                *(read_bounded(key) for key in keys), return_exceptions=True
+            )
+
+            # Decode off the event loop so large listings don't stall other requests
+            return await asyncio.to_thread(self._summarize_reports, session_id, keys, results)
             
         except Exception as e:
             logger.error(f"Failed to list reports: {e}")
             return []
     
+    @staticmethod
+    def _summarize_reports(
+        session_id: str,
+        keys: List[str],
+        results: List[Any]
+    ) -> List[EvaluationReportSummary]:
+        """Decode gathered report reads into summaries, skipping failed reads."""
+        reports = []
+        for key, report_json in zip(keys, results):
+            try:
+                if isinstance(report_json, Exception):
+                    raise report_json
+                report_data = json_utils.loads(report_json)
+                
+                # Extract report ID from the path
+                report_id = key.split('/')[-1]
+                
+                reports.append(EvaluationReportSummary(
+                    report_id=report_id,
+                    chat_session_id=session_id,
+                    created_at=report_data.get('created_at', ''),
+                    evaluation_type=report_data.get('evaluation_type', 'comprehensive')
+                ))
+            except Exception as e:
+                logger.error(f"Failed to read report {key}: {e}")
+                continue
+        
+        return reports
+    
     async def _get_report_by_id(
         self, 
         user_id: str, 
@@ -179,10 +192,13 @@ class EvaluationHandler(BaseHandler):
             user_reports_prefix = f"users/{user_id}/eval_reports/"
             report_keys = await storage.list_keys(user_reports_prefix)
             
+            # Report IDs are the last path segment; compare it exactly so one ID
+            # can't match the tail of another
+            suffix = f"/{report_id}"
             for key in report_keys:
-                if key.endswith(report_id):
+                if key.endswith(suffix):
                     report_json = await storage.read(key)
-                    report_data = json.loads(report_json)
+                    report_data = json_utils.loads(report_json)
                     report_data['report_id'] = report_id
                     return report_data
             
@@ -245,9 +261,10 @@ class EvaluationHandler(BaseHandler):
             
             # Parse and validate ChatInfo data
             try:
-                chat_info_data = json.loads(chat_info_json)
-                chat_info = ChatInfo(**chat_info_data)
-            except (json.JSONDecodeError, ValueError) as parse_err:
+                # Validate straight from the JSON text; no intermediate dict is built
+                chat_info = ChatInfo.model_validate_json(chat_info_json)
+            except ValueError as parse_err:
+                # pydantic reports malformed JSON and invalid fields as ValidationError
                 logger.error(f"Failed to parse session data for {request.session_id}: {parse_err}")
                 raise HTTPException(status_code=500, detail="Invalid session data format")
             
@@ -256,10 +273,10 @@ class EvaluationHandler(BaseHandler):
             # Replace colons with underscores for filesystem compatibility
             safe_timestamp = timestamp.replace(':', '_')
             unique_id = str(uuid.uuid4())[:8]
-            eval_session_id = f"eval_{request.session_id}_{safe_timestamp}_{unique_id}"
-            
+
             # Generate storage path for this evaluation
             storage_id = f"{safe_timestamp}_{unique_id}"  # Format: 2024-01-10T12_34_56.789Z_abcd1234
+            eval_session_id = f"eval_{request.session_id}_{storage_id}"
             
             current_session = await adk_session_service.create_session(
                 app_name=EvaluationHandler.ADK_APP_NAME,
@@ -299,7 +316,8 @@ class EvaluationHandler(BaseHandler):
                 raise HTTPException(status_code=500, detail="Evaluation agent failed to generate report")
             
             try:
-                report_response = FinalReviewReport(**completed_session.state["final_report"])
+                # output_schema makes ADK store the validated report as a plain dict
+                report_response = FinalReviewReport.model_validate(completed_session.state["final_report"])
             except ValueError as report_err:
                 logger.error(f"Invalid evaluation report format: {report_err}")
                 raise HTTPException(status_code=500, detail="Failed to parse evaluation report")
@@ -316,7 +334,7 @@ class EvaluationHandler(BaseHandler):
             }
             
             try:
-                await storage.write(report_path, json.dumps(report_data, sort_keys=True))
+                await storage.write(report_path, json_utils.dumps(report_data, sort_keys=True))
                 logger.info(f"Stored evaluation report at {report_path}")
             except Exception as store_err:
                 # Log error but don't fail the request since report was generated
@@ -18,6 +18,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent / "src" / "python"))
 from role_play.common.storage import FileStorage, FileStorageConfig, StorageBackend
 from role_play.common.auth import AuthManager
 from role_play.chat.chat_logger import ChatLogger
+from role_play.chat import chat_logger as chat_logger_module
 
 
 @pytest.fixture(scope="session")
@@ -133,6 +134,9 @@ def mock_storage() -> AsyncMock:
 @pytest.fixture
 def chat_logger(mock_storage: AsyncMock) -> ChatLogger:
     """Creates a ChatLogger instance with a mock storage backend."""
+    # Forget sessions ended and exports cached by earlier tests
+    chat_logger_module._ended_logs.clear()
+    chat_logger_module._export_cache.clear()
     return ChatLogger(storage_backend=mock_storage)
 
 
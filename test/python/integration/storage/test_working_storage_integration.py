@@ -60,6 +60,12 @@ class TestWorkingStorageFactory:
         with pytest.raises(StorageError, match="not allowed in beta"):
             create_storage_backend(config, Environment.BETA)
 
+        # Strings are normalized; unknown names and non-strings are rejected
+        assert create_storage_backend(config, "DEV") is not None
+        for environment in ("staging", None):
+            with pytest.raises(StorageError, match="Invalid environment"):
+                create_storage_backend(config, environment)
+
 
 class TestWorkingStorageMonitoring:
     """Test working storage monitoring functionality."""
@@ -168,4 +174,25 @@ class TestWorkingConfigValidation:
         )
         
         # Should not raise
-        validate_storage_config(config)
\ No newline at end of file
+        validate_storage_config(config)
+    
+    def test_invalid_configs_raise_storage_error(self):
+        """Test invalid configs are rejected with the matching rule message."""
+        from role_play.common.storage_factory import validate_storage_config
+        from role_play.common.storage import FileStorageConfig, GCSStorageConfig, S3StorageConfig, LockConfig
+        from role_play.common.exceptions import StorageError
+        
+        cases = [
+            (FileStorageConfig(base_dir="/tmp", lock=LockConfig(strategy="object")),
+             "Lock strategy 'object' not supported for file storage"),
+            (S3StorageConfig(bucket="b", lock=LockConfig(strategy="file")),
+             "File-based locking not supported for s3 storage"),
+            (GCSStorageConfig(bucket="b", lock=LockConfig(strategy="redis")),
+             "redis_host is required"),
+            (GCSStorageConfig(bucket="", lock=LockConfig(strategy="object")),
+             "bucket is required for GCS storage"),
+        ]
+        
+        for config, message in cases:
+            with pytest.raises(StorageError, match=message):
+                validate_storage_config(config)
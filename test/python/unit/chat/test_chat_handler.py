@@ -698,6 +698,35 @@ class TestChatHandlerReadOnlySession:
         )
 
 
+    @pytest.mark.asyncio
+    async def test_get_sessions_uses_end_info_from_summary(self, mock_user, mock_adk_session_service, mock_chat_logger, chat_handler):
+        """Test that ended sessions take end info from the listing instead of re-reading the log."""
+        mock_adk_session_service.get_session.return_value = None
+        mock_chat_logger.list_user_sessions.return_value = [{
+            "session_id": "ended_session_456",
+            "scenario_name": "Scenario",
+            "character_name": "Character",
+            "participant_name": "Participant",
+            "created_at": "2023-12-15T10:00:00Z",
+            "message_count": 2,
+            "storage_path": "users/test_user_123/chat_logs/ended_session_456",
+            "ended_at": "2023-12-15T10:30:00Z",
+            "ended_reason": "User ended session",
+        }]
+
+        response = await chat_handler.get_sessions(
+            current_user=mock_user,
+            chat_logger=mock_chat_logger,
+            adk_session_service=mock_adk_session_service
+        )
+
+        session = response.sessions[0]
+        assert session.is_active is False
+        assert session.ended_at == "2023-12-15T10:30:00Z"
+        assert session.ended_reason == "User ended session"
+        mock_chat_logger.get_session_end_info.assert_not_called()
+
+
 class TestChatHandlerSessionCreation:
     """Test cases for ChatHandler session creation with script support."""
 
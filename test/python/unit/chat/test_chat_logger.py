@@ -3,6 +3,8 @@ import pytest
 from unittest.mock import call, AsyncMock
 import json
 
+from role_play.chat.chat_logger import ChatLogger
+from role_play.common.storage import StorageError
 from role_play.common.time_utils import utc_now_isoformat
 
 @pytest.mark.asyncio
@@ -78,3 +80,168 @@ async def test_log_voice_session_start_and_end(chat_logger, mock_storage):
     end_log_data = json.loads(args[1])
     assert end_log_data["type"] == "voice_session_end"
     assert end_log_data["voice_stats"] == voice_stats
+
+
+@pytest.mark.asyncio
+async def test_export_session_text_reads_once(chat_logger, mock_storage):
+    events = [
+        {"type": "session_start", "app_session_id": "s1", "participant_name": "Alice", "character_name": "Bob"},
+        {"type": "message", "role": "participant", "content": "Hi", "message_number": 1},
+    ]
+    mock_storage.read.return_value = "\n".join(json.dumps(e) for e in events)
+
+    text = await chat_logger.export_session_text("test_user", "s1")
+
+    assert "Alice" in text and "Hi" in text
+    mock_storage.read.assert_awaited_once()
+    mock_storage.exists.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_export_session_text_missing_session(chat_logger, mock_storage):
+    mock_storage.read.side_effect = StorageError("Path not found")
+    mock_storage.exists.return_value = False
+
+    assert await chat_logger.export_session_text("test_user", "missing") == "Session log file not found."
+
+
+@pytest.mark.asyncio
+async def test_list_user_sessions_skips_unreadable_logs(chat_logger, mock_storage):
+    start = {"type": "session_start", "app_session_id": "s1", "timestamp": "2024-01-01T00:00:00Z"}
+    message = {"type": "message", "role": "participant", "content": "Hi"}
+    mock_storage.list_keys.return_value = ["users/u/chat_logs/bad", "users/u/chat_logs/s1"]
+    mock_storage.read.side_effect = [
+        StorageError("no index yet"),
+        StorageError("read failed"),
+        "\n".join(json.dumps(e) for e in (start, message)),
+    ]
+
+    sessions = await chat_logger.list_user_sessions("u")
+
+    assert [(s["session_id"], s["message_count"]) for s in sessions] == [("s1", 1)]
+    assert sessions[0]["participant_name"] == "Unknown"
+    # s1 is still active, so nothing is indexed
+    mock_storage.write.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_list_user_sessions_sorts_newest_first_without_timestamps(chat_logger, mock_storage):
+    logs = {
+        "users/u/chat_logs/old": {"type": "session_start", "app_session_id": "old", "timestamp": "2024-01-01T00:00:00Z"},
+        "users/u/chat_logs/none": {"type": "session_start", "app_session_id": "none"},
+        "users/u/chat_logs/new": {"type": "session_start", "app_session_id": "new", "timestamp": "2024-02-01T00:00:00Z"},
+    }
+    mock_storage.list_keys.return_value = list(logs)
+    mock_storage.read.side_effect = [StorageError("no index yet"), *(json.dumps(e) for e in logs.values())]
+
+    sessions = await chat_logger.list_user_sessions("u")
+
+    assert [s["session_id"] for s in sessions] == ["new", "old", "none"]
+
+
+@pytest.mark.asyncio
+async def test_list_user_sessions_finds_end_before_later_events(chat_logger, mock_storage):
+    events = [
+        {"type": "session_start", "app_session_id": "s1", "timestamp": "2024-01-01T00:00:00Z"},
+        {"type": "session_end", "app_session_id": "s1", "timestamp": "2024-01-01T00:10:00Z", "reason": "done"},
+        {"type": "voice_session_end", "app_session_id": "s1"},
+    ]
+    log = "\n".join(json.dumps(e) for e in events)
+    mock_storage.list_keys.return_value = ["users/u/chat_logs/s1"]
+    mock_storage.read.side_effect = [StorageError("no index yet"), log, StorageError("no index yet")]
+
+    sessions = await chat_logger.list_user_sessions("u")
+
+    assert (sessions[0]["ended_at"], sessions[0]["ended_reason"]) == ("2024-01-01T00:10:00Z", "done")
+    mock_storage.read.side_effect = [log]
+    end_info = await chat_logger.get_session_end_info("u", "s1")
+    assert (end_info["ended_at"], end_info["reason"]) == (sessions[0]["ended_at"], sessions[0]["ended_reason"])
+
+
+@pytest.mark.asyncio
+async def test_list_user_sessions_uses_index_for_ended_sessions(chat_logger, mock_storage):
+    events = [
+        {"type": "session_start", "app_session_id": "s1", "timestamp": "2024-01-01T00:00:00Z"},
+        {"type": "message", "role": "participant", "content": "Hi"},
+        {"type": "session_end", "app_session_id": "s1"},
+    ]
+    log_key = "users/u/chat_logs/s1"
+    mock_storage.list_keys.return_value = [log_key]
+    mock_storage.read.side_effect = [
+        StorageError("no index yet"), "\n".join(json.dumps(e) for e in events), StorageError("no index yet")
+    ]
+
+    first = await chat_logger.list_user_sessions("u")
+
+    index_path, index_data = mock_storage.write.call_args.args
+    assert index_path == "users/u/chat_log_index"
+
+    # Second listing is served from the index without reading the log or rewriting the index
+    mock_storage.read.side_effect = [index_data]
+    second = await chat_logger.list_user_sessions("u")
+    assert second == first
+    assert mock_storage.read.await_count == 4
+    mock_storage.write.assert_awaited_once()
+
+    # Deleted logs drop out of the listing and are compacted out of the index
+    mock_storage.list_keys.return_value = []
+    mock_storage.read.side_effect = [index_data, index_data]
+    assert await chat_logger.list_user_sessions("u") == []
+    assert mock_storage.write.call_args.args == ("users/u/chat_log_index", "")
+    mock_storage.append.assert_not_awaited()
+
+
+@pytest.mark.asyncio
+async def test_end_session_indexes_and_late_append_refreshes_entry(chat_logger, mock_storage):
+    start = {"type": "session_start", "app_session_id": "s1", "timestamp": "2024-01-01T00:00:00Z"}
+    files = {"users/u/chat_logs/s1": json.dumps(start) + "\n"}
+
+    async def read(path):
+        if path not in files:
+            raise StorageError(f"Path not found: {path}")
+        return files[path]
+
+    async def append(path, data):
+        files[path] += data
+
+    async def write(path, data):
+        files[path] = data
+
+    mock_storage.exists.return_value = True
+    mock_storage.read.side_effect = read
+    mock_storage.append.side_effect = append
+    mock_storage.write.side_effect = write
+
+    # Messages on an active session never touch the index
+    await chat_logger.log_message("u", "s1", "participant", "Hi", 1)
+    mock_storage.read.assert_not_awaited()
+
+    await chat_logger.end_session("u", "s1", total_messages=1, duration_seconds=1.0)
+    assert json.loads(files["users/u/chat_log_index"])["message_count"] == 1
+
+    # A message landing after the end refreshes the indexed summary
+    await chat_logger.log_message("u", "s1", "participant", "Late", 2)
+    assert json.loads(files["users/u/chat_log_index"])["message_count"] == 2
+
+
+@pytest.mark.asyncio
+async def test_export_of_ended_session_is_cached(chat_logger, mock_storage):
+    events = [
+        {"type": "session_start", "app_session_id": "s1", "participant_name": "Alice"},
+        {"type": "message", "role": "participant", "content": "Hi", "message_number": 1},
+        {"type": "session_end", "total_messages": 1},
+    ]
+    mock_storage.read.return_value = "\n".join(json.dumps(e) for e in events)
+
+    first = await chat_logger.export_session_text("test_user", "s1")
+    # Each request gets its own ChatLogger, so the cache must outlive the instance
+    second = await ChatLogger(storage_backend=mock_storage).export_session_text("test_user", "s1")
+
+    assert second == first
+    mock_storage.read.assert_awaited_once()
+
+    # Deleting the session drops the cached export
+    await chat_logger.delete_session("test_user", "s1")
+    mock_storage.read.side_effect = StorageError("Path not found")
+    mock_storage.exists.return_value = False
+    assert await chat_logger.export_session_text("test_user", "s1") == "Session log file not found."
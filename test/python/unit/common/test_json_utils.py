@@ -0,0 +1,39 @@
+"""Tests for JSON helpers."""
+
+import json
+
+import pytest
+from unittest.mock import patch
+
+from role_play.common import json_utils
+from role_play.common.json_utils import dumps, loads
+
+
+class TestJsonUtils:
+    """Tests for dumps/loads with and without orjson."""
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_roundtrip(self, use_orjson):
+        """Test that values survive a dumps/loads roundtrip."""
+        data = {"b": [1, 2.5, None], "a": "中文", "c": {"nested": True}}
+        backend = json_utils.orjson if use_orjson else None
+        with patch.object(json_utils, "orjson", backend):
+            text = dumps(data)
+            assert isinstance(text, str)
+            assert loads(text) == data
+            assert loads(text.encode()) == data
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_compact_sorted_output(self, use_orjson):
+        """Test that output is compact, unescaped, and optionally key-sorted."""
+        backend = json_utils.orjson if use_orjson else None
+        with patch.object(json_utils, "orjson", backend):
+            assert dumps({"b": 1, "a": "é"}, sort_keys=True) == '{"a":"é","b":1}'
+
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_invalid_json_raises_json_decode_error(self, use_orjson):
+        """Test that decode errors are json.JSONDecodeError for either backend."""
+        backend = json_utils.orjson if use_orjson else None
+        with patch.object(json_utils, "orjson", backend):
+            with pytest.raises(json.JSONDecodeError):
+                loads("{not json")
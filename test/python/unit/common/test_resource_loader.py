@@ -59,10 +59,16 @@ async def test_caching_logic(mock_storage):
     # Second call - should use cache and not call read again
     await loader.get_scenarios(language="en")
 
-    # list_keys is still called to find the path, but read is not.
-    assert mock_storage.list_keys.call_count == 2
+    # The resolved path is cached too, so neither list_keys nor read is repeated.
+    mock_storage.list_keys.assert_called_once()
     mock_storage.read.assert_called_once()
 
+    # Invalidating the file also forgets its resolved path
+    loader.invalidate_cache("resources/scenarios/scenarios.json")
+    await loader.get_scenarios(language="en")
+    assert mock_storage.list_keys.call_count == 2
+    assert mock_storage.read.call_count == 2
+
 @pytest.mark.asyncio
 async def test_cache_invalidation(mock_storage):
     """Test that cache invalidation forces a reload."""
@@ -105,6 +111,22 @@ async def test_get_scenario_by_id(mock_storage):
     assert scenario is not None
     assert scenario["name"] == "Scenario 2"
 
+@pytest.mark.asyncio
+async def test_get_by_id_index_is_reused_until_invalidated(mock_storage):
+    """Test that ID lookups reuse the per-file index and honour invalidation."""
+    path = "resources/scenarios/scenarios.json"
+    mock_storage.list_keys.return_value = [path]
+    mock_storage.read.return_value = '{"scenarios": [{"id": "s1", "name": "First"}, {"id": "s1", "name": "Dup"}]}'
+
+    loader = ResourceLoader(mock_storage, base_prefix="resources/")
+    assert (await loader.get_scenario_by_id("s1"))["name"] == "First"
+    assert await loader.get_scenario_by_id("s2") is None
+    assert mock_storage.read.call_count == 1
+
+    mock_storage.read.return_value = '{"scenarios": [{"id": "s2", "name": "Second"}]}'
+    loader.invalidate_cache(path)
+    assert (await loader.get_scenario_by_id("s2"))["name"] == "Second"
+
 @pytest.mark.asyncio
 async def test_get_character_by_id_not_found(mock_storage):
     """Test that get_character_by_id returns None if not found."""
@@ -764,6 +764,20 @@ class TestStorageBackendDefaultMethods:
             assert "test/regular.txt" in keys
             assert "test/.hidden" not in keys
 
+    @pytest.mark.asyncio
+    async def test_list_keys_nested_and_file_prefix(self):
+        """Test that list_keys walks nested directories and ignores a file prefix."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            storage = create_file_storage(temp_dir)
+
+            await storage.write("test/a", "1")
+            await storage.write("test/sub/b", "2")
+            await storage.write("test/sub/deeper/c", "3")
+
+            keys = await storage.list_keys("test/")
+            assert sorted(keys) == ["test/a", "test/sub/b", "test/sub/deeper/c"]
+            assert await storage.list_keys("test/a") == []
+
 
 @patch('role_play.common.storage.get_storage_monitor')
 class TestFileStorageMonitoring:
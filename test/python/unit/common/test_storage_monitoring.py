@@ -0,0 +1,183 @@
+"""Tests for storage and locking performance monitoring."""
+
+import pytest
+from unittest.mock import patch
+
+from role_play.common.storage_monitoring import (
+    RingBuffer,
+    StorageMonitor,
+    get_storage_monitor,
+)
+
+
+class TestRingBuffer:
+    """Tests for the fixed-size RingBuffer."""
+
+    def test_empty_buffer(self):
+        """Test that a new buffer has no valid samples."""
+        buf = RingBuffer(capacity=4)
+        assert len(buf) == 0
+        assert list(buf.valid()) == []
+
+    def test_append_below_capacity(self):
+        """Test that samples are kept while below capacity."""
+        buf = RingBuffer(capacity=4)
+        buf.append(1.0)
+        buf.append(2.0)
+        assert len(buf) == 2
+        assert list(buf.valid()) == [1.0, 2.0]
+
+    def test_overwrites_oldest_when_full(self):
+        """Test that the oldest samples are overwritten once full."""
+        buf = RingBuffer(capacity=3)
+        for value in (1.0, 2.0, 3.0, 4.0, 5.0):
+            buf.append(value)
+        assert len(buf) == 3
+        assert sorted(buf.valid()) == [3.0, 4.0, 5.0]
+
+
+class TestStorageMonitor:
+    """Tests for StorageMonitor metric collection."""
+
+    @pytest.mark.asyncio
+    async def test_lock_acquisition_success(self):
+        """Test that successful lock acquisitions are counted."""
+        monitor = StorageMonitor()
+        async with monitor.monitor_lock_acquisition("users/1", "file"):
+            pass
+
+        summary = await monitor.get_lock_metrics_summary()
+        assert summary["total_attempts"] == 1
+        assert summary["total_successes"] == 1
+        assert summary["total_failures"] == 0
+        assert summary["success_rate_percent"] == 100.0
+        assert summary["active_strategies"] == ["file"]
+
+    @pytest.mark.asyncio
+    async def test_lock_acquisition_failure(self):
+        """Test that failed lock acquisitions are counted and re-raised."""
+        monitor = StorageMonitor()
+        with pytest.raises(RuntimeError):
+            async with monitor.monitor_lock_acquisition("users/1", "redis"):
+                raise RuntimeError("lock failed")
+
+        summary = await monitor.get_lock_metrics_summary()
+        assert summary["total_attempts"] == 1
+        assert summary["total_failures"] == 1
+        assert summary["most_contended_resources"] == [
+            {"resource": "users/1", "strategy": "redis", "attempts": 1, "failures": 1}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_average_acquisition_time_uses_running_totals(self):
+        """Test that the average acquisition time covers every success."""
+        monitor = StorageMonitor()
+        # (start, acquired, released) for two acquisitions
+        timestamps = [0.0, 0.5, 0.6, 1.0, 1.1, 1.2]
+        with patch("role_play.common.storage_monitoring.time.perf_counter", side_effect=timestamps):
+            for resource in ("users/1", "users/2"):
+                async with monitor.monitor_lock_acquisition(resource, "file"):
+                    pass
+
+        summary = await monitor.get_lock_metrics_summary()
+        assert summary["average_acquisition_time_ms"] == 300.0
+
+    @pytest.mark.asyncio
+    async def test_lock_summary_reports_percentiles(self):
+        """Test that the lock summary includes percentile acquisition times."""
+        monitor = StorageMonitor()
+        async with monitor.monitor_lock_acquisition("users/1", "file"):
+            pass
+
+        summary = await monitor.get_lock_metrics_summary()
+        for key in ("p50_acquisition_time_ms", "p95_acquisition_time_ms", "p99_acquisition_time_ms"):
+            assert key in summary
+            assert summary[key] >= 0
+
+    @pytest.mark.asyncio
+    async def test_storage_operations_counted(self):
+        """Test that storage operations and errors are counted by type."""
+        monitor = StorageMonitor()
+        async with monitor.monitor_storage_operation("read"):
+            pass
+        async with monitor.monitor_storage_operation("write"):
+            pass
+        with pytest.raises(ValueError):
+            async with monitor.monitor_storage_operation("read"):
+                raise ValueError("read failed")
+        await monitor.record_connection_error("gcs")
+
+        summary = await monitor.get_storage_metrics_summary()
+        assert summary["total_operations"] == 2
+        assert summary["read_operations"] == 1
+        assert summary["write_operations"] == 1
+        assert summary["read_errors"] == 1
+        assert summary["connection_errors"] == 1
+
+    @pytest.mark.asyncio
+    async def test_reset_metrics(self):
+        """Test that reset_metrics clears all collected metrics."""
+        monitor = StorageMonitor()
+        async with monitor.monitor_lock_acquisition("users/1", "file"):
+            pass
+        async with monitor.monitor_storage_operation("read"):
+            pass
+
+        await monitor.reset_metrics()
+
+        lock_summary = await monitor.get_lock_metrics_summary()
+        storage_summary = await monitor.get_storage_metrics_summary()
+        assert lock_summary["total_attempts"] == 0
+        assert storage_summary["total_operations"] == 0
+
+    @pytest.mark.asyncio
+    async def test_prometheus_export(self):
+        """Test that Prometheus export contains the expected counters."""
+        monitor = StorageMonitor()
+        async with monitor.monitor_lock_acquisition("users/1", "file"):
+            pass
+        async with monitor.monitor_storage_operation("read"):
+            pass
+
+        output = await monitor.export_metrics_for_prometheus()
+        assert "storage_lock_attempts_total 1" in output
+        assert "storage_lock_successes_total 1" in output
+        assert "storage_operations_total 1" in output
+        assert "storage_errors_total 0" in output
+
+    @pytest.mark.asyncio
+    async def test_least_recently_used_resources_are_evicted(self):
+        """Test that tracked resources are capped and the oldest are evicted."""
+        monitor = StorageMonitor()
+        with patch("role_play.common.storage_monitoring._MAX_RESOURCES", 2):
+            for resource in ("a", "b"):
+                async with monitor.monitor_lock_acquisition(resource, "file"):
+                    pass
+            # Touch "a" so "b" becomes the least recently used entry
+            await monitor.record_lock_expiry("a", "file")
+            async with monitor.monitor_lock_acquisition("c", "file"):
+                pass
+
+        assert list(monitor._lock_metrics) == [("file", "a"), ("file", "c")]
+
+    @pytest.mark.asyncio
+    async def test_totals_survive_eviction(self):
+        """Test that evicting resources does not reduce the reported totals."""
+        monitor = StorageMonitor()
+        with patch("role_play.common.storage_monitoring._MAX_RESOURCES", 2):
+            for resource in ("a", "b", "c", "d", "e"):
+                async with monitor.monitor_lock_acquisition(resource, "file"):
+                    pass
+
+        summary = await monitor.get_lock_metrics_summary()
+        assert summary["total_attempts"] == 5
+        assert summary["total_successes"] == 5
+        output = await monitor.export_metrics_for_prometheus()
+        assert "storage_lock_attempts_total 5" in output
+        assert "storage_lock_successes_total 5" in output
+
+
+def test_get_storage_monitor_returns_singleton():
+    """Test that the global monitor is a single shared instance."""
+    assert isinstance(get_storage_monitor(), StorageMonitor)
+    assert get_storage_monitor() is get_storage_monitor()
@@ -108,6 +108,11 @@ class TestParseUtcDatetime:
         assert dt.microsecond == 123456
         assert dt.tzinfo is timezone.utc
 
+    def test_parse_with_partial_fraction(self):
+        """Test parsing fractional seconds shorter than microseconds."""
+        assert parse_utc_datetime("2023-01-01T12:00:00.5Z").microsecond == 500000
+        assert parse_utc_datetime("2023-01-01T12:00:00.123Z").microsecond == 123000
+
     def test_parse_invalid_format_raises_error(self):
         """Test that invalid format raises ValueError."""
         invalid_strings = [
@@ -121,6 +126,12 @@ class TestParseUtcDatetime:
             with pytest.raises(ValueError):
                 parse_utc_datetime(invalid_str)
 
+    def test_parse_rejects_non_ascii_digits(self):
+        """Test that non-ASCII digits are rejected, as fromisoformat does."""
+        with pytest.raises(ValueError):
+            parse_utc_datetime("\u0662\u0660\u0662\u0663-01-01T12:00:00Z")
+        assert is_valid_utc_isoformat("\u0662\u0660\u0662\u0663-01-01T12:00:00Z") is False
+
     def test_parse_non_utc_timezone_raises_error(self):
         """Test that non-UTC timezone raises ValueError."""
         iso_str = "2023-01-01T12:00:00+05:00"
@@ -175,6 +186,24 @@ class TestIsValidUtcIsoformat:
         for invalid_str in invalid_strings:
             assert is_valid_utc_isoformat(invalid_str) is False
 
+    def test_agrees_with_parser_on_other_forms(self):
+        """Test that forms outside the fast path are valid exactly when they parse."""
+        for dt_str in [
+            "2023-01-01 12:00:00Z",
+            "2023-01-01T12:00Z",
+            "2023-01-01T12:00:00-00:00",
+            "2023-01-01T12:00:00.1234567Z",
+        ]:
+            parse_utc_datetime(dt_str)
+            assert is_valid_utc_isoformat(dt_str) is True
+
+    def test_invalid_calendar_dates(self):
+        """Test that dates outside the calendar return False."""
+        assert is_valid_utc_isoformat("2023-02-29T00:00:00Z") is False
+        assert is_valid_utc_isoformat("2023-04-31T00:00:00Z") is False
+        assert is_valid_utc_isoformat("0000-01-01T00:00:00Z") is False
+        assert is_valid_utc_isoformat("2024-02-29T00:00:00Z") is True
+
     def test_none_and_non_string_inputs(self):
         """Test that None and non-string inputs return False."""
         non_string_inputs = [None, 123, [], {}, datetime.now()]
@@ -0,0 +1,29 @@
+"""Unit tests for the evaluator agent factory."""
+from role_play.chat.models import ChatInfo
+from role_play.dev_agents.evaluator_agent import MODEL, get_llm
+from role_play.dev_agents.evaluator_agent.agent import create_evaluator_agent
+
+
+def _chat_info() -> ChatInfo:
+    return ChatInfo(
+        chat_language="English",
+        chat_session_id="session_1",
+        scenario_info={"id": "s", "name": "Scenario", "description": "A visit", "compatible_character_count": 1},
+        char_info={"id": "c", "name": "Jane", "description": "A patient"},
+        goal="practice",
+        transcript_text="Trainee: Hi\nJane: Hello",
+        participant_name="Trainee",
+    )
+
+
+class TestCreateEvaluatorAgent:
+    """Test cases for create_evaluator_agent."""
+
+    def test_agents_share_one_model_instance(self):
+        """Test that every LLM agent across evaluations reuses the same model client."""
+        first = create_evaluator_agent("English", _chat_info())
+        second = create_evaluator_agent("English", _chat_info(), batched=False)
+
+        llm_agents = [first.sub_agents[0], first.sub_agents[1], second.sub_agents[1], *second.sub_agents[0].sub_agents]
+        assert all(agent.model is get_llm() for agent in llm_agents)
+        assert get_llm().model == MODEL
@@ -0,0 +1,53 @@
+"""Unit tests for the roleplay agent's production agent factory."""
+import pytest
+from unittest.mock import AsyncMock
+
+from role_play.dev_agents.roleplay_agent.agent import get_production_agent
+
+
+@pytest.fixture
+def resource_loader():
+    loader = AsyncMock()
+    loader.get_character_by_id.return_value = {"name": "Patient", "system_prompt": "You are a patient."}
+    loader.get_scenario_by_id.return_value = {"name": "Interview", "description": "A medical interview."}
+    return loader
+
+
+class TestGetProductionAgent:
+    """Test cases for get_production_agent."""
+
+    @pytest.mark.asyncio
+    async def test_builds_prompt_from_character_and_scenario(self, resource_loader):
+        """Test that the instruction combines prompt, scenario and language."""
+        agent = await get_production_agent("patient", "interview", "ja", resource_loader=resource_loader)
+
+        assert agent.name == "roleplay_patient_interview"
+        assert agent.instruction.startswith("You are a patient.\n\n**Current Scenario:**\nA medical interview.")
+        assert "Respond in Japanese language" in agent.instruction
+        assert "{script_data}" not in agent.instruction
+
+    @pytest.mark.asyncio
+    async def test_scripted_prompt_keeps_state_placeholder(self, resource_loader):
+        """Test that scripted sessions leave {script_data} for ADK state injection."""
+        agent = await get_production_agent("patient", "interview", "xx", scripted=True, resource_loader=resource_loader)
+
+        assert "Respond in English language" in agent.instruction
+        assert agent.instruction.endswith("Here is the script:\n{script_data}\n")
+
+    @pytest.mark.asyncio
+    async def test_missing_resource_returns_none(self, resource_loader):
+        """Test that an unknown character yields no agent."""
+        resource_loader.get_character_by_id.return_value = None
+
+        assert await get_production_agent("nobody", "interview", resource_loader=resource_loader) is None
+
+    @pytest.mark.asyncio
+    async def test_agents_share_model_instance(self, resource_loader):
+        """Test that agents for the same model reuse one model instance across calls."""
+        first = await get_production_agent("patient", "interview", resource_loader=resource_loader)
+        second = await get_production_agent("patient", "interview", "ja", resource_loader=resource_loader)
+        other = await get_production_agent("patient", "interview", agent_model="gemini-2.0-flash", resource_loader=resource_loader)
+
+        assert first.model is second.model
+        assert other.model.model == "gemini-2.0-flash"
+        assert other.model is not first.model
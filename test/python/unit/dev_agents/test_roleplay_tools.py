@@ -0,0 +1,62 @@
+"""Unit tests for the roleplay dev agent tools."""
+import pytest
+from unittest.mock import AsyncMock, patch
+
+from role_play.dev_agents.roleplay_agent import tools
+
+
+class TestRenderedToolCache:
+    """Test cases for cached tool output."""
+
+    @pytest.mark.asyncio
+    async def test_list_scenarios_is_rendered_once(self):
+        """Test that repeated calls reuse the rendered listing until cleared."""
+        loader = AsyncMock()
+        loader.get_scenarios.return_value = [{"id": "s1", "name": "First"}]
+        tools._render_scenarios.cache_clear()
+
+        with patch.object(tools, "get_dev_resource_loader", return_value=loader):
+            assert await tools.list_scenarios() == "- First (ID: s1)"
+            assert await tools.list_scenarios() == "- First (ID: s1)"
+            loader.get_scenarios.assert_awaited_once()
+
+            tools._render_scenarios.cache_clear()
+            await tools.list_scenarios()
+            assert loader.get_scenarios.await_count == 2
+
+        tools._render_scenarios.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_empty_listings_are_not_cached(self):
+        """Test that unknown IDs neither fill the cache nor hide resources added later."""
+        loader = AsyncMock()
+        loader.get_scenario_characters.return_value = []
+        tools._render_characters.cache_clear()
+
+        with patch.object(tools, "get_dev_resource_loader", return_value=loader):
+            assert "No characters found" in await tools.list_characters("s1")
+            loader.get_scenario_characters.return_value = [{"id": "c1", "name": "Clerk"}]
+            assert await tools.list_characters("s1") == "- Clerk (ID: c1)"
+
+        tools._render_characters.cache_clear()
+
+    @pytest.mark.asyncio
+    async def test_listing_cache_is_bounded(self):
+        """Test that the least recently used listing is evicted past the size limit."""
+        loader = AsyncMock()
+        loader.get_scenario_characters.return_value = [{"id": "c1", "name": "Clerk"}]
+        tools._render_characters.cache_clear()
+
+        with patch.object(tools, "get_dev_resource_loader", return_value=loader), \
+                patch.object(tools, "_LISTING_CACHE_SIZE", 2):
+            for scenario_id in ("s1", "s2", "s1", "s3"):
+                await tools.list_characters(scenario_id)
+            assert loader.get_scenario_characters.await_count == 3
+
+            # s2 was least recently used when s3 was added
+            await tools.list_characters("s1")
+            assert loader.get_scenario_characters.await_count == 3
+            await tools.list_characters("s2")
+            assert loader.get_scenario_characters.await_count == 4
+
+        tools._render_characters.cache_clear()
@@ -0,0 +1,107 @@
+"""Unit tests for the evaluator summary agent's report_storage_callback."""
+import json
+import pytest
+
+from google.adk.models import LlmResponse
+from google.genai import types
+
+from role_play.dev_agents.evaluator_agent.model import FinalReviewReport
+from role_play.dev_agents.evaluator_agent.sub_agents.summarize_agent import report_storage_callback
+
+
+def _assessment(score: str) -> dict:
+    return {
+        "chat_session_id": "session_1",
+        "assessment_area": "clarity",
+        "score": score,
+        "confidence": "high",
+        "positive_points": ["clear"],
+        "improvement_areas": [],
+        "specific_suggestions": [],
+    }
+
+
+def _response(text: str, partial: bool = False) -> LlmResponse:
+    return LlmResponse(
+        content=types.Content(role="model", parts=[types.Part(text=text)]),
+        partial=partial,
+    )
+
+
+@pytest.fixture
+def report_data():
+    return {
+        "chat_session_id": "session_1",
+        "overall_score": 0.1,
+        "human_review_recommended": False,
+        "overall_assessment": "Good",
+        "key_strengths_demonstrated": [],
+        "key_areas_for_development": [],
+        "actionable_next_steps": [],
+        "progress_notes_from_past_feedback": "",
+        "area_assessments": [_assessment("high"), _assessment("low")],
+    }
+
+
+class TestReportStorageCallback:
+    """Test cases for report_storage_callback."""
+
+    def test_recomputes_overall_score(self, report_data):
+        """Test that overall_score is replaced by the score-weighted average."""
+        result = report_storage_callback(None, _response(json.dumps(report_data)))
+
+        report = FinalReviewReport.model_validate_json(result.content.parts[0].text)
+        assert report.overall_score == pytest.approx(4 / 6)
+        assert report.overall_assessment == "Good"
+
+    def test_original_response_is_not_mutated(self, report_data):
+        """Test that only a copy of the first part is rewritten."""
+        text = json.dumps(report_data)
+        trailing = types.Part(text="extra")
+        response = LlmResponse(
+            content=types.Content(role="model", parts=[types.Part(text=text), trailing])
+        )
+        result = report_storage_callback(None, response)
+
+        assert response.content.parts[0].text == text
+        assert result.content.parts[0].text != text
+        assert result.content.parts[1] is trailing
+
+    def test_recovers_fenced_json_with_trailing_commas(self, report_data):
+        """Test that code fences and trailing commas do not block rescoring."""
+        text = "```json\n" + json.dumps(report_data)[:-1] + ",}\n```"
+        result = report_storage_callback(None, _response(text))
+
+        report = FinalReviewReport.model_validate_json(result.content.parts[0].text)
+        assert report.overall_score == pytest.approx(4 / 6)
+
+    def test_trailing_comma_repair_leaves_strings_alone(self, report_data):
+        """Test that commas before brackets inside string values survive the repair."""
+        report_data["overall_assessment"] = 'Said "a, ]" then ",}"'
+        text = "```json\n" + json.dumps(report_data)[:-1] + ",}\n```"
+        result = report_storage_callback(None, _response(text))
+
+        report = FinalReviewReport.model_validate_json(result.content.parts[0].text)
+        assert report.overall_assessment == 'Said "a, ]" then ",}"'
+
+    def test_ignores_trailing_commentary(self, report_data):
+        """Test that text after the JSON object does not block rescoring."""
+        text = "```json\n" + json.dumps(report_data) + "\n```\nLet me know if you need more detail."
+        result = report_storage_callback(None, _response(text))
+
+        report = FinalReviewReport.model_validate_json(result.content.parts[0].text)
+        assert report.overall_score == pytest.approx(4 / 6)
+
+    def test_empty_text_is_left_unchanged(self):
+        """Test that blank responses are not modified."""
+        assert report_storage_callback(None, _response("   ")) is None
+        assert report_storage_callback(None, LlmResponse()) is None
+        assert report_storage_callback(None, LlmResponse(content=types.Content(role="model", parts=[]))) is None
+
+    def test_invalid_json_is_left_unchanged(self):
+        """Test that unparseable responses are not modified."""
+        assert report_storage_callback(None, _response("not json")) is None
+
+    def test_partial_chunks_are_skipped(self, report_data):
+        """Test that streaming partial chunks are not rescored."""
+        assert report_storage_callback(None, _response(json.dumps(report_data), partial=True)) is None
@@ -219,6 +219,28 @@ class TestEvaluationEndpoints:
         assert exc_info.value.status_code == 404
         assert "Report not found" in str(exc_info.value.detail)
 
+    @pytest.mark.asyncio
+    async def test_get_report_by_id_requires_whole_segment(
+        self,
+        evaluation_handler,
+        mock_user,
+        mock_storage
+    ):
+        """Test that a report ID only matches a whole final path segment."""
+        mock_storage.list_keys.return_value = [
+            "users/test-user-123/eval_reports/test-session-123/2024-01-01T12_00_00Z_abcd1234"
+        ]
+
+        with pytest.raises(HTTPException) as exc_info:
+            await evaluation_handler.get_report_by_id_endpoint(
+                report_id="abcd1234",
+                current_user=mock_user,
+                storage=mock_storage
+            )
+
+        assert exc_info.value.status_code == 404
+        mock_storage.read.assert_not_called()
+
     @pytest.mark.asyncio
     async def test_create_new_evaluation(
         self,